@@ -0,0 +1,177 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO
+
+from newbrain.docs.adapters.fragmentacion import fragmentar
+from newbrain.docs.domain.entities.VersionDocumento import VersionDocumento
+
+
+# Los identificadores se usan como nombre de directorio: no admiten separadores ni `..`
+PATRON_DOCUMENTO = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]{0,127}")
+
+PATRON_VERSION = re.compile(r"(\d{6,})\.json")
+
+
+class DocumentoNoEncontrado(LookupError):
+    """El documento o la versión solicitada no existe en el almacén."""
+
+
+class AlmacenDocumentos:
+    """
+    Almacén en disco local de versiones de documentos, direccionado por contenido.
+
+    Cada versión se divide en fragmentos definidos por contenido y cada
+    fragmento se guarda una sola vez, bajo su hash SHA-256. Una revisión que
+    cambia una parte pequeña de un archivo grande sólo agrega los fragmentos
+    nuevos; la versión es un manifiesto con la lista ordenada de hashes.
+
+    Estructura en disco::
+
+        raiz/fragmentos/ab/abcdef...   contenido de cada fragmento
+        raiz/versiones/<documento>/000001.json
+
+    El número de versión sale de los nombres de los manifiestos, y cada
+    manifiesto se crea de forma exclusiva: si dos cargas simultáneas del
+    mismo documento eligen el mismo número, la segunda toma el siguiente.
+    """
+
+    def __init__(self, raiz: Path) -> None:
+        self._fragmentos = raiz / "fragmentos"
+        self._versiones = raiz / "versiones"
+        self._fragmentos.mkdir(parents=True, exist_ok=True)
+        self._versiones.mkdir(parents=True, exist_ok=True)
+
+    def guardar(self, documento_id: str, flujo: BinaryIO, nombre_archivo: str) -> VersionDocumento:
+        """Registra una versión nueva leyendo `flujo` por fragmentos."""
+        self._directorio(documento_id)  # valida el identificador antes de escribir
+        digest = hashlib.sha256()
+        hashes: list[str] = []
+        tamano = 0
+        for fragmento in fragmentar(flujo):
+            digest.update(fragmento)
+            tamano += len(fragmento)
+            hashes.append(self._guardar_fragmento(fragmento))
+
+        registrada = datetime.now()
+        manifiesto = json.dumps(
+            {
+                "nombre_archivo": nombre_archivo,
+                "tamano": tamano,
+                "hash_contenido": digest.hexdigest(),
+                "fragmentos": hashes,
+                "registrada": registrada.isoformat(),
+            }
+        ).encode("utf-8")
+        numero = self._crear_version(documento_id, manifiesto)
+        return VersionDocumento(
+            documento_id=documento_id,
+            version=numero,
+            nombre_archivo=nombre_archivo,
+            tamano=tamano,
+            hash_contenido=digest.hexdigest(),
+            fragmentos=tuple(hashes),
+            registrada=registrada,
+        )
+
+    def versiones(self, documento_id: str) -> list[VersionDocumento]:
+        return [self._leer_version(documento_id, numero) for numero in self._numeros(documento_id)]
+
+    def obtener(self, documento_id: str, version: int | None = None) -> VersionDocumento:
+        """Devuelve una versión; sin número, la más reciente."""
+        if version is None:
+            # Sólo se lee el manifiesto más reciente, no el de cada versión
+            numeros = self._numeros(documento_id)
+            if not numeros:
+                raise DocumentoNoEncontrado(documento_id)
+            version = numeros[-1]
+        return self._leer_version(documento_id, version)
+
+    def leer(self, documento_id: str, version: int | None = None) -> Iterator[bytes]:
+        """Reconstruye el contenido de una versión, fragmento por fragmento."""
+        for hash_fragmento in self.obtener(documento_id, version).fragmentos:
+            yield self._ruta_fragmento(hash_fragmento).read_bytes()
+
+    def bytes_almacenados(self) -> int:
+        """Espacio real ocupado por los fragmentos (sin duplicados)."""
+        return sum(ruta.stat().st_size for ruta in self._fragmentos.glob("*/*"))
+
+    def _crear_version(self, documento_id: str, manifiesto: bytes) -> int:
+        """Publica el manifiesto con el siguiente número libre y lo devuelve."""
+        directorio = self._directorio(documento_id)
+        directorio.mkdir(exist_ok=True)
+        temporal = self._temporal(directorio, manifiesto)
+        try:
+            numeros = self._numeros(documento_id)
+            numero = numeros[-1] + 1 if numeros else 1
+            while True:
+                try:
+                    # `link` falla si el destino existe: creación exclusiva y atómica
+                    os.link(temporal, self._ruta_version(documento_id, numero))
+                    return numero
+                except FileExistsError:
+                    numero += 1
+        finally:
+            os.unlink(temporal)
+
+    def _numeros(self, documento_id: str) -> list[int]:
+        directorio = self._directorio(documento_id)
+        if not directorio.is_dir():
+            return []
+        return sorted(
+            int(coincidencia.group(1))
+            for nombre in os.listdir(directorio)
+            if (coincidencia := PATRON_VERSION.fullmatch(nombre))
+        )
+
+    def _guardar_fragmento(self, fragmento: bytes) -> str:
+        hash_fragmento = hashlib.sha256(fragmento).hexdigest()
+        ruta = self._ruta_fragmento(hash_fragmento)
+        if not ruta.exists():
+            ruta.parent.mkdir(exist_ok=True)
+            self._escribir_atomico(ruta, fragmento)
+        return hash_fragmento
+
+    def _leer_version(self, documento_id: str, version: int) -> VersionDocumento:
+        ruta = self._ruta_version(documento_id, version)
+        if not ruta.exists():
+            raise DocumentoNoEncontrado(f"{documento_id} v{version}")
+        datos = json.loads(ruta.read_text(encoding="utf-8"))
+        return VersionDocumento(
+            documento_id=documento_id,
+            version=version,
+            nombre_archivo=datos["nombre_archivo"],
+            tamano=datos["tamano"],
+            hash_contenido=datos["hash_contenido"],
+            fragmentos=tuple(datos["fragmentos"]),
+            registrada=datetime.fromisoformat(datos["registrada"]),
+        )
+
+    def _ruta_fragmento(self, hash_fragmento: str) -> Path:
+        return self._fragmentos / hash_fragmento[:2] / hash_fragmento
+
+    def _ruta_version(self, documento_id: str, version: int) -> Path:
+        return self._directorio(documento_id) / f"{version:06d}.json"
+
+    def _directorio(self, documento_id: str) -> Path:
+        if not PATRON_DOCUMENTO.fullmatch(documento_id):
+            raise ValueError(f"Identificador de documento no válido: {documento_id!r}")
+        return self._versiones / documento_id
+
+    @classmethod
+    def _escribir_atomico(cls, ruta: Path, contenido: bytes) -> None:
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(cls._temporal(ruta.parent, contenido), ruta)
+
+    @staticmethod
+    def _temporal(directorio: Path, contenido: bytes) -> Path:
+        """Escribe `contenido` en un archivo temporal propio de quien lo llama."""
+        descriptor, nombre = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(contenido)
+        return Path(nombre)
@@ -0,0 +1,55 @@
+import hashlib
+from collections.abc import Iterator
+from typing import BinaryIO
+
+TAMANO_MINIMO = 2 * 1024
+TAMANO_PROMEDIO = 8 * 1024  # debe ser potencia de dos
+TAMANO_MAXIMO = 64 * 1024
+TAMANO_LECTURA = 256 * 1024
+
+_MASCARA_64 = (1 << 64) - 1
+
+
+def _tabla_gear() -> tuple[int, ...]:
+    # Tabla fija y reproducible: los cortes deben ser iguales entre ejecuciones
+    return tuple(int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], "big") for i in range(256))
+
+
+_GEAR = _tabla_gear()
+
+
+def fragmentar(
+    flujo: BinaryIO,
+    minimo: int = TAMANO_MINIMO,
+    promedio: int = TAMANO_PROMEDIO,
+    maximo: int = TAMANO_MAXIMO,
+) -> Iterator[bytes]:
+    """
+    Divide un flujo en fragmentos definidos por contenido (hash gear).
+
+    Un corte ocurre donde el hash rodante cumple una condición que sólo
+    depende de los bytes recientes, así que insertar o borrar algo en un
+    documento sólo cambia los fragmentos cercanos a la edición. El flujo se
+    lee por bloques: nunca se carga completo en memoria.
+    """
+    # Bits altos: dependen de más bytes recientes que los bajos
+    mascara = (promedio - 1) << (64 - promedio.bit_length() + 1)
+    gear = _GEAR
+    actual = bytearray()
+    h = 0
+    while bloque := flujo.read(TAMANO_LECTURA):
+        inicio = 0
+        for posicion, byte in enumerate(bloque):
+            h = ((h << 1) + gear[byte]) & _MASCARA_64
+            tamano = len(actual) + posicion - inicio + 1
+            if tamano < minimo:
+                continue
+            if (h & mascara) == 0 or tamano >= maximo:
+                actual += bloque[inicio : posicion + 1]
+                yield bytes(actual)
+                actual.clear()
+                inicio = posicion + 1
+                h = 0
+        actual += bloque[inicio:]
+    if actual:
+        yield bytes(actual)
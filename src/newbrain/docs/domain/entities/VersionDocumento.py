@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class VersionDocumento:
+    """
+    Versión conservada de un documento controlado (ISO 9001:2015, 7.5.3).
+
+    Una versión nunca se modifica; un cambio al documento produce una
+    versión nueva. `fragmentos` lista, en orden, los hashes de los
+    fragmentos de contenido que la forman.
+    """
+
+    documento_id: str
+    version: int
+    nombre_archivo: str
+    tamano: int
+    hash_contenido: str
+    fragmentos: tuple[str, ...]
+    registrada: datetime
+
+    def __str__(self) -> str:
+        return f"{self.documento_id} v{self.version} {self.nombre_archivo}"
@@ -0,0 +1,163 @@
+import hashlib
+import random
+import re
+import unicodedata
+from array import array
+from collections.abc import Iterable
+
+_PRIMO = (1 << 61) - 1
+_PALABRA = re.compile(r"[a-z0-9]+")
+
+
+def normalizar(texto: str) -> list[str]:
+    """Palabras en minúsculas y sin acentos."""
+    descompuesto = unicodedata.normalize("NFKD", texto.lower())
+    sin_acentos = "".join(c for c in descompuesto if not unicodedata.combining(c))
+    return _PALABRA.findall(sin_acentos)
+
+
+def tejas(texto: str, k: int = 3) -> set[int]:
+    """Conjunto de k-gramas de palabras (shingles), como hashes de 64 bits."""
+    palabras = normalizar(texto)
+    if len(palabras) < k:
+        gramas = [" ".join(palabras)] if palabras else []
+    else:
+        gramas = [" ".join(palabras[i : i + k]) for i in range(len(palabras) - k + 1)]
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode("utf-8"), digest_size=8).digest(), "big")
+        for g in gramas
+    }
+
+
+class IndiceCasiDuplicados:
+    """
+    Índice de sugerencias casi duplicadas (MinHash + LSH).
+
+    Cada texto se resume en una firma MinHash cuyo porcentaje de posiciones
+    coincidentes estima la similitud de Jaccard entre sus shingles. La firma
+    se divide en bandas; dos textos son candidatos si coinciden en al menos
+    una banda completa, así que una búsqueda sólo compara contra los textos
+    que comparten cubeta y no contra todo el histórico.
+
+    Un texto sin palabras (vacío o sólo puntuación) no tiene firma: no se
+    indexa ni se considera parecido a nada.
+    """
+
+    def __init__(
+        self,
+        permutaciones: int = 128,
+        bandas: int = 32,
+        k: int = 3,
+        umbral: float = 0.5,
+        semilla: int = 2024,
+    ) -> None:
+        if permutaciones % bandas:
+            raise ValueError("El número de permutaciones debe ser múltiplo de las bandas")
+        self.k = k
+        self.umbral = umbral
+        self._bandas = bandas
+        self._filas = permutaciones // bandas
+        azar = random.Random(semilla)
+        self._coeficientes = [
+            (azar.randrange(1, _PRIMO), azar.randrange(0, _PRIMO)) for _ in range(permutaciones)
+        ]
+        self._firmas: dict[str, array] = {}
+        self._cubetas: list[dict[tuple[int, ...], list[str]]] = [{} for _ in range(bandas)]
+
+    def firma(self, texto: str) -> array | None:
+        valores = tejas(texto, self.k)
+        if not valores:
+            return None
+        return array(
+            "Q",
+            (min((a * x + b) % _PRIMO for x in valores) for a, b in self._coeficientes),
+        )
+
+    def agregar(self, id_: str, texto: str) -> None:
+        """Indexa el texto; si el id ya estaba, su texto anterior se reemplaza."""
+        self.eliminar(id_)
+        firma = self.firma(texto)
+        if firma is None:
+            return
+        self._firmas[id_] = firma
+        for banda, clave in enumerate(self._claves_banda(firma)):
+            self._cubetas[banda].setdefault(clave, []).append(id_)
+
+    def eliminar(self, id_: str) -> None:
+        firma = self._firmas.pop(id_, None)
+        if firma is None:
+            return
+        for banda, clave in enumerate(self._claves_banda(firma)):
+            ids = self._cubetas[banda][clave]
+            ids.remove(id_)
+            if not ids:
+                del self._cubetas[banda][clave]
+
+    def agregar_muchas(self, textos: Iterable[tuple[str, str]]) -> None:
+        for id_, texto in textos:
+            self.agregar(id_, texto)
+
+    def similares(self, texto: str, umbral: float | None = None) -> list[tuple[str, float]]:
+        """Sugerencias indexadas parecidas a `texto`, de mayor a menor similitud."""
+        umbral = self.umbral if umbral is None else umbral
+        firma = self.firma(texto)
+        if firma is None:
+            return []
+        candidatos: set[str] = set()
+        for banda, clave in enumerate(self._claves_banda(firma)):
+            candidatos.update(self._cubetas[banda].get(clave, ()))
+        resultado = [
+            (id_, similitud)
+            for id_ in candidatos
+            if (similitud := self._similitud(firma, self._firmas[id_])) >= umbral
+        ]
+        return sorted(resultado, key=lambda par: (-par[1], par[0]))
+
+    def agrupar(self, umbral: float | None = None) -> list[list[str]]:
+        """
+        Agrupa todo el histórico en conjuntos de sugerencias casi duplicadas.
+
+        Sólo se comparan los pares que comparten cubeta; los grupos son las
+        componentes conexas de los pares que superan el umbral. Se omiten
+        las sugerencias sin duplicados.
+        """
+        umbral = self.umbral if umbral is None else umbral
+        padres = {id_: id_ for id_ in self._firmas}
+
+        def raiz(id_: str) -> str:
+            while padres[id_] != id_:
+                padres[id_] = padres[padres[id_]]
+                id_ = padres[id_]
+            return id_
+
+        comparados: set[tuple[str, str]] = set()
+        for cubetas in self._cubetas:
+            for ids in cubetas.values():
+                for i, a in enumerate(ids):
+                    for b in ids[i + 1 :]:
+                        par = (a, b) if a < b else (b, a)
+                        if par in comparados:
+                            continue
+                        comparados.add(par)
+                        if self._similitud(self._firmas[a], self._firmas[b]) >= umbral:
+                            padres[raiz(a)] = raiz(b)
+
+        grupos: dict[str, list[str]] = {}
+        for id_ in self._firmas:
+            grupos.setdefault(raiz(id_), []).append(id_)
+        return sorted(
+            (sorted(grupo) for grupo in grupos.values() if len(grupo) > 1),
+            key=lambda grupo: grupo[0],
+        )
+
+    def __len__(self) -> int:
+        return len(self._firmas)
+
+    def _claves_banda(self, firma: array) -> Iterable[tuple[int, ...]]:
+        filas = self._filas
+        for banda in range(self._bandas):
+            yield tuple(firma[banda * filas : (banda + 1) * filas])
+
+    @staticmethod
+    def _similitud(a: array, b: array) -> float:
+        return sum(x == y for x, y in zip(a, b)) / len(a)
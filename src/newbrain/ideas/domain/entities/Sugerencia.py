@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class Sugerencia:
+    """
+    Propuesta de mejora recibida por el canal IDEAS.
+    """
+
+    id: str
+    titulo: str
+    descripcion: str
+    registrada: datetime
+
+    @property
+    def texto(self) -> str:
+        """Texto completo que se compara para detectar sugerencias repetidas."""
+        return f"{self.titulo}. {self.descripcion}"
+
+    def __str__(self) -> str:
+        return f"{self.id} {self.titulo}"
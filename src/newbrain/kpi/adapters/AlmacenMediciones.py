@@ -0,0 +1,217 @@
+from array import array
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from typing import Literal
+
+from newbrain.kpi.domain.entities.Medicion import Medicion
+from newbrain.kpi.domain.value_objects.ResumenMedicion import ResumenMedicion
+from newbrain.shared.contratos.UbicacionGeoelectoral import (
+    NIVELES_AGREGACION,
+    NivelAgregacion,
+    UbicacionGeoelectoral,
+)
+
+Granularidad = Literal["dia", "semana", "mes"]
+
+GRANULARIDADES: tuple[Granularidad, ...] = ("dia", "semana", "mes")
+
+# Filas por bloque columnar antes de sellarlo y abrir otro
+FILAS_POR_BLOQUE = 8_192
+
+
+def inicio_periodo(instante: datetime | date, granularidad: Granularidad) -> date:
+    dia = instante.date() if isinstance(instante, datetime) else instante
+    if granularidad == "dia":
+        return dia
+    if granularidad == "semana":
+        return dia - timedelta(days=dia.weekday())
+    return dia.replace(day=1)
+
+
+class _Acumulador:
+    __slots__ = ("mediciones", "suma", "minimo", "maximo")
+
+    def __init__(self) -> None:
+        self.mediciones = 0
+        self.suma = 0.0
+        self.minimo = float("inf")
+        self.maximo = float("-inf")
+
+    def agregar(self, valor: float) -> None:
+        self.mediciones += 1
+        self.suma += valor
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+
+    def resumen(self) -> ResumenMedicion:
+        return ResumenMedicion(self.mediciones, self.suma, self.minimo, self.maximo)
+
+
+class _Bloque:
+    """Mediciones de un indicador guardadas por columnas en arreglos compactos."""
+
+    def __init__(self, proceso_electoral_id: str, zona: tzinfo) -> None:
+        self.proceso_electoral_id = proceso_electoral_id
+        self.zona = zona
+        self.instantes = array("d")
+        self.valores = array("d")
+        self.entidades = array("H")
+        self.distritos = array("H")
+        self.municipios = array("H")
+        self.secciones = array("H")
+        self.desde = float("inf")
+        self.hasta = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def agregar(self, marca: float, medicion: Medicion) -> None:
+        ubicacion = medicion.ubicacion
+        self.instantes.append(marca)
+        self.valores.append(medicion.valor)
+        self.entidades.append(ubicacion.entidad)
+        self.distritos.append(ubicacion.distrito_electoral_federal)
+        self.municipios.append(ubicacion.municipio)
+        self.secciones.append(ubicacion.seccion)
+        self.desde = min(self.desde, marca)
+        self.hasta = max(self.hasta, marca)
+
+    def filas(self, indicador: str, desde: float, hasta: float) -> Iterator[Medicion]:
+        if self.hasta < desde or self.desde >= hasta:
+            return
+        for i, marca in enumerate(self.instantes):
+            if desde <= marca < hasta:
+                yield Medicion(
+                    indicador=indicador,
+                    instante=datetime.fromtimestamp(marca, self.zona),
+                    ubicacion=UbicacionGeoelectoral(
+                        self.proceso_electoral_id,
+                        self.entidades[i],
+                        self.distritos[i],
+                        self.municipios[i],
+                        self.secciones[i],
+                    ),
+                    valor=self.valores[i],
+                )
+
+
+class AlmacenMediciones:
+    """
+    Almacén de series de tiempo de indicadores con resúmenes precalculados.
+
+    Las mediciones crudas se anexan a bloques columnares por indicador y
+    proceso electoral. Al insertar, se actualizan los resúmenes diarios,
+    semanales y mensuales de la sección y de cada unidad que la contiene
+    (municipio, distrito federal, entidad), de modo que los tableros leen
+    resúmenes y no puntos crudos.
+
+    Los instantes se normalizan a la zona horaria `zona` (UTC por omisión):
+    en ella se cortan los días, semanas y meses, y con ella se devuelven las
+    mediciones crudas. Un instante sin zona se interpreta en `zona`.
+    """
+
+    def __init__(self, zona: tzinfo = UTC) -> None:
+        self.zona = zona
+        self._bloques: dict[tuple[str, str], list[_Bloque]] = {}
+        # (indicador, proceso, granularidad, nivel, unidad) -> periodo -> acumulador
+        self._resumenes: dict[tuple, dict[date, _Acumulador]] = {}
+
+    def agregar(self, medicion: Medicion) -> None:
+        ubicacion = medicion.ubicacion
+        instante = self._normalizar(medicion.instante)
+        bloques = self._bloques.setdefault((medicion.indicador, ubicacion.proceso_electoral_id), [])
+        if not bloques or len(bloques[-1]) >= FILAS_POR_BLOQUE:
+            bloques.append(_Bloque(ubicacion.proceso_electoral_id, self.zona))
+        bloques[-1].agregar(instante.timestamp(), medicion)
+
+        for granularidad in GRANULARIDADES:
+            periodo = inicio_periodo(instante, granularidad)
+            for nivel in NIVELES_AGREGACION:
+                clave = (
+                    medicion.indicador,
+                    ubicacion.proceso_electoral_id,
+                    granularidad,
+                    nivel,
+                    ubicacion.unidad(nivel),
+                )
+                periodos = self._resumenes.setdefault(clave, {})
+                acumulador = periodos.get(periodo)
+                if acumulador is None:
+                    acumulador = periodos[periodo] = _Acumulador()
+                acumulador.agregar(medicion.valor)
+
+    def agregar_muchas(self, mediciones: Iterable[Medicion]) -> None:
+        for medicion in mediciones:
+            self.agregar(medicion)
+
+    def serie(
+        self,
+        indicador: str,
+        proceso_id: str,
+        granularidad: Granularidad,
+        nivel: NivelAgregacion,
+        unidad: tuple[int, ...],
+        desde: date,
+        hasta: date,
+    ) -> list[tuple[date, ResumenMedicion]]:
+        """Resúmenes por periodo de una unidad, con periodos en [desde, hasta)."""
+        periodos = self._resumenes.get((indicador, proceso_id, granularidad, nivel, unidad), {})
+        return [
+            (periodo, periodos[periodo].resumen())
+            for periodo in sorted(periodos)
+            if desde <= periodo < hasta
+        ]
+
+    def resumen(
+        self,
+        indicador: str,
+        proceso_id: str,
+        nivel: NivelAgregacion,
+        unidad: tuple[int, ...],
+        desde: date,
+        hasta: date,
+    ) -> ResumenMedicion | None:
+        """
+        Resumen total de una unidad en [desde, hasta).
+
+        Combina meses completos y completa los extremos con días, así que un
+        rango de varios meses se resuelve con pocas decenas de resúmenes.
+        """
+        partes = []
+        dia = desde
+        while dia < hasta:
+            mes = inicio_periodo(dia, "mes")
+            siguiente_mes = (mes + timedelta(days=32)).replace(day=1)
+            if dia == mes and siguiente_mes <= hasta:
+                partes += self._periodos(indicador, proceso_id, "mes", nivel, unidad, dia)
+                dia = siguiente_mes
+            else:
+                partes += self._periodos(indicador, proceso_id, "dia", nivel, unidad, dia)
+                dia += timedelta(days=1)
+        if not partes:
+            return None
+        total = partes[0]
+        for parte in partes[1:]:
+            total = total + parte
+        return total
+
+    def mediciones(
+        self, indicador: str, proceso_id: str, desde: datetime, hasta: datetime
+    ) -> Iterator[Medicion]:
+        """Mediciones crudas en [desde, hasta); omite los bloques fuera del rango."""
+        inicio, fin = self._normalizar(desde).timestamp(), self._normalizar(hasta).timestamp()
+        for bloque in self._bloques.get((indicador, proceso_id), []):
+            yield from bloque.filas(indicador, inicio, fin)
+
+    def _normalizar(self, instante: datetime) -> datetime:
+        if instante.tzinfo is None:
+            return instante.replace(tzinfo=self.zona)
+        return instante.astimezone(self.zona)
+
+    def _periodos(self, indicador, proceso_id, granularidad, nivel, unidad, periodo) -> list:
+        acumulador = self._resumenes.get(
+            (indicador, proceso_id, granularidad, nivel, unidad), {}
+        ).get(periodo)
+        return [acumulador.resumen()] if acumulador is not None else []
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from newbrain.shared.contratos.UbicacionGeoelectoral import UbicacionGeoelectoral
+
+
+@dataclass(frozen=True)
+class Medicion:
+    """
+    Valor observado de un indicador en una sección y un instante.
+
+    Las mediciones no se corrigen: un valor erróneo se compensa con una
+    nueva medición (ISO 9001:2015, 9.1).
+    """
+
+    indicador: str
+    instante: datetime
+    ubicacion: UbicacionGeoelectoral
+    valor: float
+
+    def __str__(self) -> str:
+        return f"{self.indicador} {self.ubicacion} {self.instante:%Y-%m-%d %H:%M} = {self.valor}"
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ResumenMedicion:
+    """Estadísticos de un conjunto de mediciones de un indicador."""
+
+    mediciones: int
+    suma: float
+    minimo: float
+    maximo: float
+
+    @property
+    def promedio(self) -> float:
+        return self.suma / self.mediciones if self.mediciones else 0.0
+
+    def __add__(self, otro: "ResumenMedicion") -> "ResumenMedicion":
+        return ResumenMedicion(
+            mediciones=self.mediciones + otro.mediciones,
+            suma=self.suma + otro.suma,
+            minimo=min(self.minimo, otro.minimo),
+            maximo=max(self.maximo, otro.maximo),
+        )
@@ -0,0 +1,241 @@
+from collections.abc import Collection, Iterable, Iterator, Mapping
+from dataclasses import astuple, dataclass, field, fields
+from operator import attrgetter
+from typing import TypeVar
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import entidad_de
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+T = TypeVar("T")
+
+CAMPO_PROCESO = "proceso_electoral_id"
+
+
+@dataclass(frozen=True)
+class ResumenDelta:
+    """Resultado de registrar un proceso como delta sobre su predecesor."""
+
+    proceso_id: str
+    base_id: str | None
+    altas: int = 0
+    cambios: int = 0
+    bajas: int = 0
+    compartidos: int = 0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.proceso_id} sobre {self.base_id}: +{self.altas} ~{self.cambios} "
+            f"-{self.bajas} ={self.compartidos}"
+        )
+
+
+@dataclass
+class _Version:
+    """Registros propios de un proceso; lo demás se hereda de `base`."""
+
+    base: "_Version | None"
+    # tipo -> id -> valores del registro sin el proceso electoral
+    registros: dict[type, dict[int, tuple]] = field(default_factory=dict)
+    bajas: dict[type, set[int]] = field(default_factory=dict)
+
+    def buscar(self, tipo: type, id_: int) -> tuple | None:
+        version = self
+        while version is not None:
+            valores = version.registros.get(tipo, {}).get(id_)
+            if valores is not None:
+                return valores
+            if id_ in version.bajas.get(tipo, ()):
+                return None
+            version = version.base
+        return None
+
+    def recorrer(self, tipo: type) -> Iterator[tuple]:
+        vistos: set[int] = set()
+        version = self
+        while version is not None:
+            for id_, valores in version.registros.get(tipo, {}).items():
+                if id_ not in vistos:
+                    vistos.add(id_)
+                    yield valores
+            vistos.update(version.bajas.get(tipo, ()))
+            version = version.base
+
+
+class _Esquema:
+    """Separa y reintegra el proceso electoral de los valores de un registro."""
+
+    def __init__(self, tipo: type) -> None:
+        nombres = [f.name for f in fields(tipo)]
+        self.tipo = tipo
+        self.posicion = nombres.index(CAMPO_PROCESO)
+
+    def separar(self, registro) -> tuple:
+        valores = astuple(registro)
+        return valores[: self.posicion] + valores[self.posicion + 1 :]
+
+    def construir(self, valores: tuple, proceso_id: str):
+        return self.tipo(*valores[: self.posicion], proceso_id, *valores[self.posicion :])
+
+
+class AlmacenMGEVersionado:
+    """
+    Almacén del MGE con versiones por proceso electoral y estructura compartida.
+
+    Cada proceso se guarda como un delta sobre su predecesor: los registros
+    que no cambian (mismo id y mismos valores) no se duplican, se heredan.
+    Los valores se guardan sin `proceso_electoral_id`; el proceso se resuelve
+    al leer, según la vista consultada. Implementa RepositorioMGE.
+    """
+
+    def __init__(self) -> None:
+        self._procesos: dict[str, ProcesoElectoral] = {}
+        self._versiones: dict[str, _Version] = {}
+        self._entidades: list[EntidadFederativa] = []
+        self._esquemas: dict[type, _Esquema] = {}
+
+    def agregar_entidades(self, entidades: Iterable[EntidadFederativa]) -> None:
+        self._entidades.extend(entidades)
+
+    def registrar_proceso(
+        self,
+        proceso: ProcesoElectoral,
+        registros: Iterable,
+        base_id: str | None = None,
+    ) -> ResumenDelta:
+        """
+        Registra el MGE completo de `proceso`, guardando sólo lo que difiere de
+        `base_id`. Los registros de la base ausentes en `registros` son bajas.
+        """
+        base = self._version_base(proceso.id, base_id)
+        version = _Version(base=base)
+        altas = cambios = compartidos = 0
+        presentes: dict[type, set[int]] = {}
+
+        for registro in registros:
+            esquema = self._esquema(type(registro))
+            valores = esquema.separar(registro)
+            presentes.setdefault(esquema.tipo, set()).add(registro.id)
+            anterior = base.buscar(esquema.tipo, registro.id) if base else None
+            if anterior == valores:
+                compartidos += 1
+                continue
+            if anterior is None:
+                altas += 1
+            else:
+                cambios += 1
+            version.registros.setdefault(esquema.tipo, {})[registro.id] = valores
+
+        bajas = 0
+        if base is not None:
+            for tipo in self._esquemas:
+                ids = presentes.get(tipo, set())
+                for valores in base.recorrer(tipo):
+                    id_ = valores[0]  # `id` es el primer campo de toda entidad versionada
+                    if id_ not in ids:
+                        version.bajas.setdefault(tipo, set()).add(id_)
+                        bajas += 1
+
+        self._guardar(proceso, version)
+        return ResumenDelta(proceso.id, base_id, altas, cambios, bajas, compartidos)
+
+    def aplicar_delta(
+        self,
+        proceso: ProcesoElectoral,
+        base_id: str,
+        cambios: Iterable = (),
+        bajas: Mapping[type, Iterable[int]] | None = None,
+    ) -> ResumenDelta:
+        """Registra `proceso` a partir de un delta explícito sobre `base_id`."""
+        base = self._version_base(proceso.id, base_id)
+        version = _Version(base=base)
+        altas = modificados = 0
+        for registro in cambios:
+            esquema = self._esquema(type(registro))
+            if base.buscar(esquema.tipo, registro.id) is None:
+                altas += 1
+            else:
+                modificados += 1
+            version.registros.setdefault(esquema.tipo, {})[registro.id] = esquema.separar(registro)
+
+        total_bajas = 0
+        for tipo, ids in (bajas or {}).items():
+            ids = set(ids)
+            version.bajas.setdefault(tipo, set()).update(ids)
+            total_bajas += len(ids)
+
+        self._guardar(proceso, version)
+        return ResumenDelta(proceso.id, base_id, altas, modificados, total_bajas)
+
+    def obtener_proceso(self, proceso_id: str) -> ProcesoElectoral:
+        return self._procesos[proceso_id]
+
+    def obtener(self, tipo: type[T], proceso_id: str, id_: int) -> T | None:
+        if tipo not in self._esquemas or proceso_id not in self._versiones:
+            return None
+        valores = self._versiones[proceso_id].buscar(tipo, id_)
+        if valores is None:
+            return None
+        return self._esquemas[tipo].construir(valores, proceso_id)
+
+    def iterar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        entidad_id: int | None = None,
+    ) -> Iterator[T]:
+        if tipo is EntidadFederativa:
+            registros: Iterable = self._entidades
+        elif tipo not in self._esquemas or proceso_id not in self._versiones:
+            return
+        else:
+            esquema = self._esquemas[tipo]
+            registros = (
+                esquema.construir(valores, proceso_id)
+                for valores in self._versiones[proceso_id].recorrer(tipo)
+            )
+        for registro in registros:
+            if entidad_id is None or entidad_de(registro) == entidad_id:
+                yield registro
+
+    def buscar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        campos: tuple[str, ...],
+        claves: Collection[tuple],
+    ) -> Iterator[T]:
+        if campos == ("id",) and tipo is not EntidadFederativa:
+            for (id_,) in claves:
+                registro = self.obtener(tipo, proceso_id, id_)
+                if registro is not None:
+                    yield registro
+            return
+        valores = attrgetter(*campos)
+        buscadas = {clave[0] for clave in claves} if len(campos) == 1 else set(claves)
+        for registro in self.iterar(tipo, proceso_id):
+            if valores(registro) in buscadas:
+                yield registro
+
+    def registros_propios(self, proceso_id: str) -> int:
+        """Número de registros almacenados por el proceso (sin contar los heredados)."""
+        version = self._versiones[proceso_id]
+        return sum(len(registros) for registros in version.registros.values())
+
+    def _version_base(self, proceso_id: str, base_id: str | None) -> _Version | None:
+        if proceso_id in self._versiones:
+            raise ValueError(f"El proceso {proceso_id} ya está registrado")
+        if base_id is None:
+            return None
+        if base_id not in self._versiones:
+            raise KeyError(f"Proceso base no registrado: {base_id}")
+        return self._versiones[base_id]
+
+    def _guardar(self, proceso: ProcesoElectoral, version: _Version) -> None:
+        self._procesos[proceso.id] = proceso
+        self._versiones[proceso.id] = version
+
+    def _esquema(self, tipo: type) -> _Esquema:
+        if tipo not in self._esquemas:
+            self._esquemas[tipo] = _Esquema(tipo)
+        return self._esquemas[tipo]
@@ -0,0 +1,98 @@
+from collections.abc import Collection, Iterable, Iterator
+from operator import attrgetter
+from typing import TypeVar
+
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+T = TypeVar("T")
+
+
+def entidad_de(registro) -> int:
+    """Devuelve la entidad federativa a la que pertenece un registro del MGE."""
+    if isinstance(registro, EntidadFederativa):
+        return registro.entidad
+    if hasattr(registro, "entidad_id"):
+        return registro.entidad_id
+    # LocalidadPuntual nombra el campo como entidad_int
+    return registro.entidad_int
+
+
+class RepositorioMGEMemoria:
+    """
+    Implementación en memoria de RepositorioMGE y AlmacenMGE.
+
+    Útil para pruebas y para cargar un MGE completo ya resuelto. Los
+    registros se indexan por id: agregar uno existente lo reemplaza.
+    """
+
+    def __init__(self) -> None:
+        self._procesos: dict[str, ProcesoElectoral] = {}
+        self._entidades: dict[int, EntidadFederativa] = {}
+        self._registros: dict[tuple[type, str], dict[int, object]] = {}
+
+    def agregar_proceso(self, proceso: ProcesoElectoral) -> None:
+        self._procesos[proceso.id] = proceso
+
+    def agregar(self, registros: Iterable) -> None:
+        for registro in registros:
+            if isinstance(registro, ProcesoElectoral):
+                self.agregar_proceso(registro)
+            elif isinstance(registro, EntidadFederativa):
+                self._entidades[registro.entidad] = registro
+            else:
+                clave = (type(registro), str(registro.proceso_electoral_id))
+                self._registros.setdefault(clave, {})[registro.id] = registro
+
+    def guardar(self, registros: Iterable) -> None:
+        self.agregar(registros)
+
+    def eliminar(self, tipo: type, proceso_id: str, ids: Iterable[int]) -> None:
+        registros = (
+            self._entidades
+            if tipo is EntidadFederativa
+            else self._registros.get((tipo, proceso_id), {})
+        )
+        for id_ in ids:
+            registros.pop(id_, None)
+
+    def obtener_proceso(self, proceso_id: str) -> ProcesoElectoral:
+        return self._procesos[proceso_id]
+
+    def iterar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        entidad_id: int | None = None,
+    ) -> Iterator[T]:
+        if tipo is EntidadFederativa:
+            registros = self._entidades
+        else:
+            registros = self._registros.get((tipo, proceso_id), {})
+        for registro in registros.values():
+            if entidad_id is None or entidad_de(registro) == entidad_id:
+                yield registro
+
+    def buscar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        campos: tuple[str, ...],
+        claves: Collection[tuple],
+    ) -> Iterator[T]:
+        if tipo is EntidadFederativa:
+            registros = self._entidades
+        else:
+            registros = self._registros.get((tipo, proceso_id), {})
+        llave = ("entidad",) if tipo is EntidadFederativa else ("id",)
+        if campos == llave:
+            # Búsqueda por llave primaria: acceso directo al índice
+            for (id_,) in claves:
+                if id_ in registros:
+                    yield registros[id_]
+            return
+        valores = attrgetter(*campos)
+        buscadas = {clave[0] for clave in claves} if len(campos) == 1 else set(claves)
+        for registro in registros.values():
+            if valores(registro) in buscadas:
+                yield registro
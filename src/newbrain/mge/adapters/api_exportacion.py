@@ -0,0 +1,45 @@
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+
+from newbrain.mge.application.ExportadorMGE import ExportadorMGE
+from newbrain.mge.application.RepositorioMGE import TIPOS_MGE, RepositorioMGE
+
+TIPOS_CONTENIDO = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def crear_router_exportacion(repositorio: RepositorioMGE) -> APIRouter:
+    """
+    Router de exportación masiva del MGE.
+
+    La respuesta se transmite en bloques conforme se recorre el repositorio.
+    """
+    router = APIRouter(prefix="/mge", tags=["mge"])
+    exportador = ExportadorMGE(repositorio)
+
+    @router.get("/procesos/{proceso_id}/exportacion/{nivel}")
+    def exportar_nivel(
+        proceso_id: str,
+        nivel: str,
+        formato: str = "csv",
+        gzip: bool = False,
+    ) -> StreamingResponse:
+        if nivel not in TIPOS_MGE:
+            raise HTTPException(status_code=404, detail=f"Nivel desconocido: {nivel}")
+        if formato not in TIPOS_CONTENIDO:
+            raise HTTPException(status_code=400, detail=f"Formato no soportado: {formato}")
+
+        # Con gzip se entrega el archivo comprimido tal cual, sin Content-Encoding:
+        # así el cliente no lo descomprime y lo guarda con su extensión .gz
+        extension = formato + (".gz" if gzip else "")
+        return StreamingResponse(
+            exportador.generar(proceso_id, nivel, formato, comprimir=gzip),
+            media_type="application/gzip" if gzip else TIPOS_CONTENIDO[formato],
+            headers={
+                "Content-Disposition": f'attachment; filename="{proceso_id}_{nivel}.{extension}"'
+            },
+        )
+
+    return router
@@ -0,0 +1,30 @@
+from newbrain.mge.application.ConstructorExpedientes import SolicitudExpediente
+from newbrain.mge.domain.aggregates import ExpedienteMGE
+
+
+class CacheExpedientes:
+    """
+    Caché en memoria de expedientes ya construidos.
+
+    El MGE de un proceso no se reescribe, así que un expediente construido
+    sigue siendo válido mientras el proceso esté cargado; no hay expiración.
+    """
+
+    def __init__(self) -> None:
+        self._expedientes: dict[SolicitudExpediente, ExpedienteMGE] = {}
+
+    def obtener(self, solicitud: SolicitudExpediente) -> ExpedienteMGE | None:
+        return self._expedientes.get(solicitud)
+
+    def guardar(self, solicitud: SolicitudExpediente, expediente: ExpedienteMGE) -> None:
+        self._expedientes[solicitud] = expediente
+
+    def descartar_proceso(self, proceso_id: str) -> None:
+        for solicitud in [s for s in self._expedientes if s.proceso_id == proceso_id]:
+            del self._expedientes[solicitud]
+
+    def __contains__(self, solicitud: SolicitudExpediente) -> bool:
+        return solicitud in self._expedientes
+
+    def __len__(self) -> int:
+        return len(self._expedientes)
@@ -0,0 +1,126 @@
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+
+from newbrain.mge.application.CacheExpedientes import CacheExpedientes
+from newbrain.mge.application.ConstructorExpedientes import (
+    ConstructorExpedientes,
+    SolicitudExpediente,
+)
+from newbrain.mge.application.RepositorioMGE import RepositorioMGE
+from newbrain.mge.domain.aggregates import ExpedienteMGE, NivelGeoElectoral
+
+NIVELES_CALENTAMIENTO: tuple[NivelGeoElectoral, ...] = (
+    "entidad",
+    "distrito_electoral_federal",
+    "distrito_electoral_local",
+    "municipio",
+)
+
+# (nivel, expedientes terminados, total del nivel)
+AlAvanzar = Callable[[str, int, int], None]
+
+
+@dataclass(frozen=True)
+class AvanceNivel:
+    """Resultado del precálculo de un nivel."""
+
+    nivel: str
+    expedientes: int
+    errores: tuple[str, ...]
+    segundos: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.nivel}: {self.expedientes} expedientes en {self.segundos:.2f} s"
+            f" ({len(self.errores)} errores)"
+        )
+
+
+@dataclass(frozen=True)
+class ReporteCalentamiento:
+    proceso_id: str
+    niveles: tuple[AvanceNivel, ...]
+
+    @property
+    def expedientes(self) -> int:
+        return sum(avance.expedientes for avance in self.niveles)
+
+    @property
+    def segundos(self) -> float:
+        return sum(avance.segundos for avance in self.niveles)
+
+
+# Estado de cada proceso trabajador; se inicializa una vez por proceso
+_constructor: ConstructorExpedientes | None = None
+
+
+def _inicializar_trabajador(repositorio: RepositorioMGE) -> None:
+    global _constructor
+    _constructor = ConstructorExpedientes(repositorio)
+
+
+def _construir(
+    solicitud: SolicitudExpediente,
+) -> tuple[SolicitudExpediente, ExpedienteMGE | None, str | None]:
+    try:
+        return solicitud, _constructor.construir(solicitud), None
+    except Exception as exc:  # se reporta en el avance, no interrumpe el nivel
+        return solicitud, None, f"{solicitud}: {exc}"
+
+
+def calentar_expedientes(
+    repositorio: RepositorioMGE,
+    proceso_id: str,
+    cache: CacheExpedientes,
+    niveles: Sequence[NivelGeoElectoral] = NIVELES_CALENTAMIENTO,
+    procesos: int | None = None,
+    al_avanzar: AlAvanzar | None = None,
+    contexto: BaseContext | None = None,
+) -> ReporteCalentamiento:
+    """
+    Precalcula todos los expedientes de los niveles indicados, en todas las
+    entidades, y los deja en `cache` antes de recibir tráfico.
+
+    La construcción se reparte en un pool de procesos; el repositorio se
+    envía una sola vez a cada trabajador. Salvo con el método de arranque
+    `fork`, eso implica serializarlo con pickle: con `spawn` (macOS) o
+    `forkserver` (Linux desde Python 3.14) el repositorio debe poder
+    serializarse. `contexto` permite fijar el método de arranque.
+    """
+    constructor = ConstructorExpedientes(repositorio)
+    trabajadores = procesos or os.cpu_count() or 1
+    avances: list[AvanceNivel] = []
+    with ProcessPoolExecutor(
+        max_workers=trabajadores,
+        initializer=_inicializar_trabajador,
+        initargs=(repositorio,),
+        mp_context=contexto,
+    ) as pool:
+        for nivel in niveles:
+            inicio = time.perf_counter()
+            solicitudes = list(constructor.solicitudes(proceso_id, nivel))
+            total = len(solicitudes)
+            lote = max(1, total // (4 * trabajadores))
+            errores: list[str] = []
+            terminados = 0
+            for solicitud, expediente, error in pool.map(_construir, solicitudes, chunksize=lote):
+                if error is None:
+                    cache.guardar(solicitud, expediente)
+                else:
+                    errores.append(error)
+                terminados += 1
+                if al_avanzar is not None:
+                    al_avanzar(nivel, terminados, total)
+            avances.append(
+                AvanceNivel(
+                    nivel=nivel,
+                    expedientes=total - len(errores),
+                    errores=tuple(errores),
+                    segundos=time.perf_counter() - inicio,
+                )
+            )
+    return ReporteCalentamiento(proceso_id, tuple(avances))
@@ -0,0 +1,168 @@
+import asyncio
+from collections.abc import Iterable
+from operator import attrgetter
+from typing import Generic, TypeVar
+
+from newbrain.mge.application.ConstructorExpedientes import ExpedienteNoEncontrado
+from newbrain.mge.application.RepositorioMGE import RepositorioMGE
+from newbrain.mge.domain.aggregates import ExpedienteMGE
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.LimiteLocalidad import LimiteLocalidad
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+T = TypeVar("T")
+
+
+class CargadorMGE(Generic[T]):
+    """
+    Cargador por lotes (estilo dataloader) de un tipo de entidad del MGE.
+
+    Las claves pedidas durante una misma vuelta del event loop se acumulan y
+    se resuelven con una sola consulta `buscar` al repositorio. Cada clave se
+    memoriza: pedirla de nuevo no vuelve a consultar. Una clave puede tener
+    varios registros (p. ej. las manzanas de una sección), por eso `cargar`
+    devuelve una tupla.
+    """
+
+    def __init__(
+        self,
+        repositorio: RepositorioMGE,
+        tipo: type[T],
+        proceso_id: str,
+        campos: tuple[str, ...] = ("id",),
+    ) -> None:
+        self._repositorio = repositorio
+        self._tipo = tipo
+        self._proceso_id = proceso_id
+        self._campos = campos
+        self._memoria: dict[tuple, asyncio.Future[tuple[T, ...]]] = {}
+        self._pendientes: dict[tuple, asyncio.Future[tuple[T, ...]]] = {}
+        self.consultas = 0
+
+    def cargar(self, *clave) -> "asyncio.Future[tuple[T, ...]]":
+        futuro = self._memoria.get(clave)
+        if futuro is not None:
+            return futuro
+        loop = asyncio.get_running_loop()
+        futuro = loop.create_future()
+        self._memoria[clave] = futuro
+        if not self._pendientes:
+            # Se despacha después de que corran las tareas ya listas en esta vuelta
+            loop.call_soon(self._despachar)
+        self._pendientes[clave] = futuro
+        return futuro
+
+    async def cargar_uno(self, *clave) -> T:
+        registros = await self.cargar(*clave)
+        if not registros:
+            raise ExpedienteNoEncontrado(
+                f"{self._tipo.__name__} {dict(zip(self._campos, clave))} "
+                f"no encontrado en el proceso {self._proceso_id}"
+            )
+        return registros[0]
+
+    async def cargar_muchos(self, claves: Iterable[tuple]) -> list[tuple[T, ...]]:
+        return list(await asyncio.gather(*(self.cargar(*clave) for clave in claves)))
+
+    def _despachar(self) -> None:
+        pendientes, self._pendientes = self._pendientes, {}
+        self.consultas += 1
+        try:
+            encontrados: dict[tuple, list[T]] = {clave: [] for clave in pendientes}
+            valores = attrgetter(*self._campos)
+            for registro in self._repositorio.buscar(
+                self._tipo, self._proceso_id, self._campos, list(pendientes)
+            ):
+                clave = valores(registro)
+                encontrados[clave if len(self._campos) > 1 else (clave,)].append(registro)
+        except Exception as exc:
+            for clave, futuro in pendientes.items():
+                # Un fallo no debe quedar memorizado: se reintenta en la siguiente carga
+                self._memoria.pop(clave, None)
+                if not futuro.done():
+                    futuro.set_exception(exc)
+            return
+        for clave, futuro in pendientes.items():
+            if not futuro.done():
+                futuro.set_result(tuple(encontrados[clave]))
+
+
+class CargadoresMGE:
+    """
+    Cargadores de todas las entidades del MGE para un proceso electoral.
+
+    Se crea uno por solicitud (o por lote de expedientes): la memorización
+    vive lo que vive esta instancia.
+    """
+
+    def __init__(self, repositorio: RepositorioMGE, proceso_id: str) -> None:
+        self._repositorio = repositorio
+        self.proceso_id = proceso_id
+        self._proceso: ProcesoElectoral | None = None
+        self._cargadores: dict[tuple[type, tuple[str, ...]], CargadorMGE] = {}
+
+    def de(self, tipo: type[T], *campos: str) -> CargadorMGE[T]:
+        campos = campos or (("entidad",) if tipo is EntidadFederativa else ("id",))
+        clave = (tipo, campos)
+        if clave not in self._cargadores:
+            self._cargadores[clave] = CargadorMGE(self._repositorio, tipo, self.proceso_id, campos)
+        return self._cargadores[clave]
+
+    async def proceso(self) -> ProcesoElectoral:
+        if self._proceso is None:
+            self._proceso = self._repositorio.obtener_proceso(self.proceso_id)
+        return self._proceso
+
+    @property
+    def consultas(self) -> int:
+        """Consultas masivas hechas al repositorio (sin contar el proceso)."""
+        return sum(cargador.consultas for cargador in self._cargadores.values())
+
+
+async def cargar_expediente_seccion(
+    cargadores: CargadoresMGE, entidad_id: int, seccion_id: int
+) -> ExpedienteMGE:
+    """
+    Arma el Expediente Sección usando los cargadores por lotes.
+
+    Si se arman muchos expedientes a la vez (con `asyncio.gather`), cada
+    tipo de entidad se consulta una vez por etapa y no una vez por sección.
+    """
+    proceso, entidad, seccion = await asyncio.gather(
+        cargadores.proceso(),
+        cargadores.de(EntidadFederativa).cargar_uno(entidad_id),
+        cargadores.de(SeccionElectoral).cargar_uno(seccion_id),
+    )
+    if seccion.entidad_id != entidad_id:
+        raise ExpedienteNoEncontrado(f"La sección {seccion_id} no es de la entidad {entidad_id}")
+
+    distritos_federales, distritos_locales, municipios, manzanas = await asyncio.gather(
+        cargadores.de(DistritoElectoralFederal).cargar(seccion.distrito_electoral_federal_id),
+        cargadores.de(DistritoElectoralLocal).cargar(seccion.distrito_electoral_local_id),
+        cargadores.de(Municipio, "entidad_id", "municipio_id").cargar(
+            entidad_id, seccion.municipio_id
+        ),
+        cargadores.de(Manzana, "entidad_id", "seccion_id").cargar(entidad_id, seccion.seccion),
+    )
+    # Localidades en las que hay manzanas de la sección
+    en_seccion = sorted({(m.municipio_id, m.localidad_id) for m in manzanas})
+    localidades = await cargadores.de(
+        LimiteLocalidad, "entidad_id", "municipio_id", "localidad_id"
+    ).cargar_muchos((entidad_id, municipio, localidad) for municipio, localidad in en_seccion)
+
+    return ExpedienteMGE.crear(
+        proceso=proceso,
+        entidad=entidad,
+        nivel="seccion",
+        distritos_federales=distritos_federales,
+        distritos_locales=distritos_locales,
+        municipios=municipios,
+        secciones=[seccion],
+        localidades=[localidad for grupo in localidades for localidad in grupo],
+        manzanas=manzanas,
+    )
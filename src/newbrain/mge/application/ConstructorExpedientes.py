@@ -0,0 +1,154 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+from newbrain.mge.application.RepositorioMGE import RepositorioMGE
+from newbrain.mge.domain.aggregates import ExpedienteMGE, NivelGeoElectoral
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.LimiteLocalidad import LimiteLocalidad
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+# Tipo de la unidad que identifica `unidad_id` en cada nivel
+TIPO_UNIDAD: dict[str, type] = {
+    "distrito_electoral_federal": DistritoElectoralFederal,
+    "distrito_electoral_local": DistritoElectoralLocal,
+    "municipio": Municipio,
+    "seccion": SeccionElectoral,
+}
+
+
+class ExpedienteNoEncontrado(LookupError):
+    """La unidad solicitada no existe en el MGE del proceso."""
+
+
+@dataclass(frozen=True)
+class SolicitudExpediente:
+    """
+    Identifica un expediente: proceso, entidad, nivel y unidad.
+
+    `unidad_id` es el id del distrito, municipio o sección; en el nivel
+    entidad no aplica y se deja en None.
+    """
+
+    proceso_id: str
+    entidad_id: int
+    nivel: NivelGeoElectoral
+    unidad_id: int | None = None
+
+    def __str__(self) -> str:
+        unidad = "" if self.unidad_id is None else f" {self.unidad_id}"
+        return f"{self.proceso_id} {self.entidad_id:02d} {self.nivel}{unidad}"
+
+
+class ConstructorExpedientes:
+    """Arma y valida un ExpedienteMGE a partir del repositorio del MGE."""
+
+    def __init__(self, repositorio: RepositorioMGE) -> None:
+        self._repositorio = repositorio
+
+    def construir(self, solicitud: SolicitudExpediente) -> ExpedienteMGE:
+        proceso = self._repositorio.obtener_proceso(solicitud.proceso_id)
+        entidad = self._unico(EntidadFederativa, solicitud, lambda e: True)
+        piezas = getattr(self, f"_piezas_{solicitud.nivel}")(solicitud)
+        return ExpedienteMGE.crear(
+            proceso=proceso, entidad=entidad, nivel=solicitud.nivel, **piezas
+        )
+
+    def solicitudes(
+        self, proceso_id: str, nivel: NivelGeoElectoral
+    ) -> Iterator[SolicitudExpediente]:
+        """Enumera todas las solicitudes posibles de un nivel en todas las entidades."""
+        for entidad in self._repositorio.iterar(EntidadFederativa, proceso_id):
+            if nivel == "entidad":
+                yield SolicitudExpediente(proceso_id, entidad.entidad, nivel)
+                continue
+            unidades = self._repositorio.iterar(TIPO_UNIDAD[nivel], proceso_id, entidad.entidad)
+            for unidad in unidades:
+                yield SolicitudExpediente(proceso_id, entidad.entidad, nivel, unidad.id)
+
+    def _piezas_entidad(self, solicitud: SolicitudExpediente) -> dict:
+        return {
+            "distritos_federales": self._todos(DistritoElectoralFederal, solicitud),
+            "distritos_locales": self._todos(DistritoElectoralLocal, solicitud),
+            "municipios": self._todos(Municipio, solicitud),
+            "secciones": self._todos(SeccionElectoral, solicitud),
+        }
+
+    def _piezas_distrito_electoral_federal(self, solicitud: SolicitudExpediente) -> dict:
+        distrito = self._unidad(solicitud)
+        return {
+            "distritos_federales": [distrito],
+            "secciones": self._todos(
+                SeccionElectoral,
+                solicitud,
+                lambda s: s.distrito_electoral_federal_id == distrito.id,
+            ),
+        }
+
+    def _piezas_distrito_electoral_local(self, solicitud: SolicitudExpediente) -> dict:
+        distrito = self._unidad(solicitud)
+        return {
+            "distritos_locales": [distrito],
+            "secciones": self._todos(
+                SeccionElectoral,
+                solicitud,
+                lambda s: s.distrito_electoral_local_id == distrito.id,
+            ),
+        }
+
+    def _piezas_municipio(self, solicitud: SolicitudExpediente) -> dict:
+        municipio = self._unidad(solicitud)
+        return {
+            "municipios": [municipio],
+            "secciones": self._todos(
+                SeccionElectoral, solicitud, lambda s: s.municipio_id == municipio.municipio_id
+            ),
+        }
+
+    def _piezas_seccion(self, solicitud: SolicitudExpediente) -> dict:
+        seccion = self._unidad(solicitud)
+        manzanas = self._todos(Manzana, solicitud, lambda m: m.seccion_id == seccion.seccion)
+        # Localidades en las que hay manzanas de la sección
+        en_seccion = {(m.municipio_id, m.localidad_id) for m in manzanas}
+        return {
+            "secciones": [seccion],
+            "distritos_federales": self._todos(
+                DistritoElectoralFederal,
+                solicitud,
+                lambda d: d.id == seccion.distrito_electoral_federal_id,
+            ),
+            "distritos_locales": self._todos(
+                DistritoElectoralLocal,
+                solicitud,
+                lambda d: d.id == seccion.distrito_electoral_local_id,
+            ),
+            "municipios": self._todos(
+                Municipio, solicitud, lambda m: m.municipio_id == seccion.municipio_id
+            ),
+            # Mismo orden que CargadorMGE: por (municipio, localidad)
+            "localidades": sorted(
+                self._todos(
+                    LimiteLocalidad,
+                    solicitud,
+                    lambda loc: (loc.municipio_id, loc.localidad_id) in en_seccion,
+                ),
+                key=lambda loc: (loc.municipio_id, loc.localidad_id),
+            ),
+            "manzanas": manzanas,
+        }
+
+    def _unidad(self, solicitud: SolicitudExpediente):
+        tipo = TIPO_UNIDAD[solicitud.nivel]
+        return self._unico(tipo, solicitud, lambda u: u.id == solicitud.unidad_id)
+
+    def _unico(self, tipo: type, solicitud: SolicitudExpediente, condicion):
+        for registro in self._todos(tipo, solicitud, condicion):
+            return registro
+        raise ExpedienteNoEncontrado(f"{tipo.__name__} no encontrado para {solicitud}")
+
+    def _todos(self, tipo: type, solicitud: SolicitudExpediente, condicion=None) -> list:
+        registros = self._repositorio.iterar(tipo, solicitud.proceso_id, solicitud.entidad_id)
+        return [r for r in registros if condicion is None or condicion(r)]
@@ -0,0 +1,227 @@
+import csv
+import io
+import json
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+from newbrain.mge.application.RepositorioMGE import TIPOS_MGE, RepositorioMGE
+
+FormatoExportacion = Literal["csv", "ndjson", "parquet"]
+
+# Tamaño a partir del cual el búfer de texto se codifica y se entrega.
+TAMANO_BLOQUE = 64 * 1024
+# Filas por row group en el formato columnar.
+FILAS_POR_LOTE = 50_000
+
+
+@dataclass(frozen=True)
+class ResultadoExportacion:
+    """Resumen de la exportación de un nivel del MGE."""
+
+    nivel: str
+    formato: str
+    filas: int
+    segundos: float
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.filas / self.segundos if self.segundos > 0 else float(self.filas)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.nivel}: {self.filas} filas en {self.segundos:.2f} s "
+            f"({self.filas_por_segundo:,.0f} filas/s)"
+        )
+
+
+class ExportadorMGE:
+    """
+    Exporta el MGE completo de un proceso electoral, nivel por nivel.
+
+    Los registros se leen del repositorio como generadores y se escriben en
+    bloques, de modo que la memoria usada no depende del tamaño del MGE.
+    """
+
+    def __init__(self, repositorio: RepositorioMGE) -> None:
+        self._repositorio = repositorio
+
+    def generar(
+        self,
+        proceso_id: str,
+        nivel: str,
+        formato: FormatoExportacion = "csv",
+        comprimir: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        Genera el contenido de un nivel en bloques de bytes (CSV o NDJSON).
+
+        Pensado para respuestas en streaming: nunca se construye el archivo
+        completo en memoria.
+        """
+        if formato == "parquet":
+            raise ValueError("El formato columnar sólo puede escribirse a un archivo")
+        texto = self._texto_csv if formato == "csv" else self._texto_ndjson
+        bloques = _en_bloques(texto(proceso_id, nivel))
+        return _gzip(bloques) if comprimir else bloques
+
+    def exportar_nivel(
+        self,
+        proceso_id: str,
+        nivel: str,
+        salida: BinaryIO | Path,
+        formato: FormatoExportacion = "csv",
+        comprimir: bool = False,
+    ) -> ResultadoExportacion:
+        """Escribe un nivel en `salida` y reporta el rendimiento obtenido."""
+        inicio = time.perf_counter()
+        contador = _Contador()
+        if formato == "parquet":
+            _escribir_parquet(
+                contador.contar(self._filas(proceso_id, nivel)),
+                TIPOS_MGE[nivel],
+                salida,
+                comprimir,
+            )
+        else:
+            texto = self._texto_csv if formato == "csv" else self._texto_ndjson
+            bloques = _en_bloques(texto(proceso_id, nivel, contador))
+            if comprimir:
+                bloques = _gzip(bloques)
+            with _abrir(salida) as destino:
+                for bloque in bloques:
+                    destino.write(bloque)
+        return ResultadoExportacion(
+            nivel=nivel,
+            formato=formato,
+            filas=contador.filas,
+            segundos=time.perf_counter() - inicio,
+        )
+
+    def exportar_proceso(
+        self,
+        proceso_id: str,
+        directorio: Path,
+        formato: FormatoExportacion = "csv",
+        comprimir: bool = False,
+    ) -> list[ResultadoExportacion]:
+        """Exporta todos los niveles del proceso, un archivo por nivel."""
+        directorio.mkdir(parents=True, exist_ok=True)
+        extension = formato + (".gz" if comprimir and formato != "parquet" else "")
+        return [
+            self.exportar_nivel(
+                proceso_id, nivel, directorio / f"{nivel}.{extension}", formato, comprimir
+            )
+            for nivel in TIPOS_MGE
+        ]
+
+    def _filas(self, proceso_id: str, nivel: str) -> Iterator[tuple]:
+        for registro in self._repositorio.iterar(TIPOS_MGE[nivel], proceso_id):
+            yield astuple(registro)
+
+    def _texto_csv(
+        self, proceso_id: str, nivel: str, contador: "_Contador | None" = None
+    ) -> Iterator[str]:
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, lineterminator="\n")
+        escritor.writerow(f.name for f in fields(TIPOS_MGE[nivel]))
+        filas = self._filas(proceso_id, nivel)
+        for fila in contador.contar(filas) if contador else filas:
+            escritor.writerow(fila)
+            if buffer.tell() >= TAMANO_BLOQUE:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue()
+
+    def _texto_ndjson(
+        self, proceso_id: str, nivel: str, contador: "_Contador | None" = None
+    ) -> Iterator[str]:
+        nombres = [f.name for f in fields(TIPOS_MGE[nivel])]
+        filas = self._filas(proceso_id, nivel)
+        for fila in contador.contar(filas) if contador else filas:
+            yield json.dumps(dict(zip(nombres, fila)), ensure_ascii=False) + "\n"
+
+
+class _Contador:
+    def __init__(self) -> None:
+        self.filas = 0
+
+    def contar(self, filas: Iterator[tuple]) -> Iterator[tuple]:
+        for fila in filas:
+            self.filas += 1
+            yield fila
+
+
+def _en_bloques(textos: Iterator[str]) -> Iterator[bytes]:
+    """Agrupa fragmentos de texto en bloques de al menos TAMANO_BLOQUE bytes."""
+    pendientes: list[str] = []
+    tamano = 0
+    for texto in textos:
+        pendientes.append(texto)
+        tamano += len(texto)
+        if tamano >= TAMANO_BLOQUE:
+            yield "".join(pendientes).encode("utf-8")
+            pendientes.clear()
+            tamano = 0
+    if pendientes:
+        yield "".join(pendientes).encode("utf-8")
+
+
+def _gzip(bloques: Iterator[bytes]) -> Iterator[bytes]:
+    compresor = zlib.compressobj(wbits=31)  # 16 + 15: cabecera gzip
+    for bloque in bloques:
+        comprimido = compresor.compress(bloque)
+        if comprimido:
+            yield comprimido
+    yield compresor.flush()
+
+
+@contextmanager
+def _abrir(salida: BinaryIO | Path) -> Iterator[BinaryIO]:
+    """Abre una ruta o reutiliza un archivo binario ya abierto sin cerrarlo."""
+    if isinstance(salida, Path):
+        with open(salida, "wb") as archivo:
+            yield archivo
+    else:
+        yield salida
+
+
+def _escribir_parquet(
+    filas: Iterator[tuple], tipo: type, salida: BinaryIO | Path, comprimir: bool
+) -> None:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise RuntimeError(
+            "La exportación columnar requiere pyarrow (pip install newbrain[export])"
+        ) from exc
+
+    tipos_arrow = {int: pa.int64(), str: pa.string()}
+    columnas = fields(tipo)
+    esquema = pa.schema([(f.name, tipos_arrow[f.type]) for f in columnas])
+    compresion = "gzip" if comprimir else "none"
+    destino = str(salida) if isinstance(salida, Path) else salida
+
+    with pq.ParquetWriter(destino, esquema, compression=compresion) as escritor:
+        lote: list[tuple] = []
+        for fila in filas:
+            lote.append(fila)
+            if len(lote) >= FILAS_POR_LOTE:
+                escritor.write_batch(_lote_arrow(pa, esquema, lote))
+                lote.clear()
+        if lote:
+            escritor.write_batch(_lote_arrow(pa, esquema, lote))
+
+
+def _lote_arrow(pa, esquema, lote: list[tuple]):
+    columnas = list(zip(*lote))
+    return pa.record_batch(
+        [pa.array(columna, type=campo.type) for columna, campo in zip(columnas, esquema)],
+        schema=esquema,
+    )
@@ -0,0 +1,193 @@
+import csv
+import hashlib
+import json
+import os
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, fields
+from pathlib import Path
+
+from newbrain.mge.application.RepositorioMGE import TIPOS_MGE, AlmacenMGE
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+
+# Registros que se acumulan antes de enviarlos al almacén
+TAMANO_LOTE = 5_000
+
+
+@dataclass(frozen=True)
+class ArchivoFuente:
+    """
+    Archivo CSV entregado por el INE para un nivel, proceso y entidad.
+
+    Las columnas del CSV llevan los nombres de los campos de la entidad.
+    """
+
+    ruta: Path
+    nivel: str
+    proceso_id: str
+    entidad_id: int
+
+    @property
+    def clave(self) -> str:
+        return f"{self.proceso_id}/{self.entidad_id:02d}/{self.nivel}"
+
+
+@dataclass(frozen=True)
+class ResultadoIngesta:
+    clave: str
+    omitido: bool
+    altas: int = 0
+    cambios: int = 0
+    bajas: int = 0
+    segundos: float = 0.0
+
+    def __str__(self) -> str:
+        if self.omitido:
+            return f"{self.clave}: sin cambios"
+        return f"{self.clave}: +{self.altas} ~{self.cambios} -{self.bajas} ({self.segundos:.2f} s)"
+
+
+class ManifiestoIngesta:
+    """
+    Registro de lo ya ingerido: por cada archivo fuente, el hash de su
+    contenido y la huella de cada una de sus filas, indexada por id.
+
+    El manifiesto describe lo que contiene el almacén y debe vivir lo mismo
+    que él. Sin `directorio` se conserva sólo en memoria, como el almacén de
+    RepositorioMGEMemoria. Con `directorio` se persiste en disco y sólo debe
+    usarse con un almacén persistente: con uno volátil, tras un reinicio se
+    omitirían archivos cuyas filas ya no están en el almacén.
+
+    En disco cada archivo fuente tiene su hash (`.sha256`) y sus huellas
+    (`.json`). Omitir un archivo sin cambios sólo lee su hash, y registrar
+    uno reescribe sólo los archivos de esa clave, de forma atómica.
+    """
+
+    def __init__(self, directorio: Path | None = None) -> None:
+        self._directorio = directorio
+        self._hashes: dict[str, str] = {}
+        # Sin directorio, las huellas sólo existen aquí
+        self._huellas: dict[str, dict[str, str]] = {}
+
+    def hash_de(self, clave: str) -> str | None:
+        if clave not in self._hashes and self._directorio is not None:
+            ruta = self._ruta(clave, ".sha256")
+            if ruta.exists():
+                self._hashes[clave] = ruta.read_text(encoding="ascii").strip()
+        return self._hashes.get(clave)
+
+    def huellas_de(self, clave: str) -> dict[str, str]:
+        if self._directorio is None:
+            return self._huellas.get(clave, {})
+        ruta = self._ruta(clave, ".json")
+        if not ruta.exists():
+            return {}
+        return json.loads(ruta.read_text(encoding="utf-8"))
+
+    def registrar(self, clave: str, hash_contenido: str, huellas: dict[str, str]) -> None:
+        if self._directorio is None:
+            self._huellas[clave] = huellas
+        else:
+            # El hash se escribe al final: si la escritura se interrumpe, el
+            # archivo fuente no se omite y se vuelve a comparar fila por fila
+            _escribir_atomico(self._ruta(clave, ".json"), json.dumps(huellas))
+            _escribir_atomico(self._ruta(clave, ".sha256"), hash_contenido)
+        self._hashes[clave] = hash_contenido
+
+    def _ruta(self, clave: str, sufijo: str) -> Path:
+        return self._directorio.joinpath(*clave.split("/")).with_suffix(sufijo)
+
+
+class IngestaMGE:
+    """
+    Ingesta incremental de los archivos fuente del MGE.
+
+    Un archivo idéntico byte a byte al de la entrega anterior se omite sin
+    leerlo como CSV. En uno que cambió, sólo las filas nuevas o modificadas
+    se convierten en entidades y se guardan; los ids que desaparecieron se
+    eliminan del almacén. El manifiesto se actualiza archivo por archivo, y
+    sólo para los que se aplicaron.
+    """
+
+    def __init__(self, almacen: AlmacenMGE, manifiesto: ManifiestoIngesta) -> None:
+        self._almacen = almacen
+        self._manifiesto = manifiesto
+
+    def ingerir(self, archivos: Iterable[ArchivoFuente]) -> list[ResultadoIngesta]:
+        return [self.ingerir_archivo(archivo) for archivo in archivos]
+
+    def ingerir_archivo(self, archivo: ArchivoFuente) -> ResultadoIngesta:
+        inicio = time.perf_counter()
+        hash_contenido = hash_archivo(archivo.ruta)
+        if hash_contenido == self._manifiesto.hash_de(archivo.clave):
+            return ResultadoIngesta(archivo.clave, omitido=True)
+
+        tipo = TIPOS_MGE[archivo.nivel]
+        anteriores = self._manifiesto.huellas_de(archivo.clave)
+        huellas: dict[str, str] = {}
+        altas = cambios = 0
+        lote = []
+
+        for id_, huella, fila in _filas_con_huella(archivo.ruta, campo_id(tipo)):
+            huellas[id_] = huella
+            anterior = anteriores.get(id_)
+            if anterior == huella:
+                continue
+            if anterior is None:
+                altas += 1
+            else:
+                cambios += 1
+            lote.append(_convertir(tipo, fila))
+            if len(lote) >= TAMANO_LOTE:
+                self._almacen.guardar(lote)
+                lote = []
+        if lote:
+            self._almacen.guardar(lote)
+
+        eliminados = [int(id_) for id_ in anteriores.keys() - huellas.keys()]
+        if eliminados:
+            self._almacen.eliminar(tipo, archivo.proceso_id, eliminados)
+
+        self._manifiesto.registrar(archivo.clave, hash_contenido, huellas)
+        return ResultadoIngesta(
+            archivo.clave,
+            omitido=False,
+            altas=altas,
+            cambios=cambios,
+            bajas=len(eliminados),
+            segundos=time.perf_counter() - inicio,
+        )
+
+
+def campo_id(tipo: type) -> str:
+    """Nombre del campo que identifica a los registros de un tipo del MGE."""
+    return "entidad" if tipo is EntidadFederativa else "id"
+
+
+def hash_archivo(ruta: Path) -> str:
+    digest = hashlib.sha256()
+    with open(ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1024 * 1024), b""):
+            digest.update(bloque)
+    return digest.hexdigest()
+
+
+def _escribir_atomico(ruta: Path, texto: str) -> None:
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    temporal = ruta.with_suffix(ruta.suffix + ".tmp")
+    temporal.write_text(texto, encoding="utf-8")
+    os.replace(temporal, ruta)
+
+
+def _filas_con_huella(ruta: Path, campo: str) -> Iterator[tuple[str, str, dict[str, str]]]:
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.reader(archivo)
+        encabezado = next(lector, [])
+        posicion = encabezado.index(campo)
+        for valores in lector:
+            huella = hashlib.blake2b("\x1f".join(valores).encode("utf-8"), digest_size=8)
+            yield valores[posicion], huella.hexdigest(), dict(zip(encabezado, valores))
+
+
+def _convertir(tipo: type, fila: dict[str, str]):
+    return tipo(**{f.name: f.type(fila[f.name]) for f in fields(tipo)})
@@ -0,0 +1,122 @@
+import sys
+import weakref
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import fields, replace
+from typing import TypeVar
+
+from newbrain.mge.application.RepositorioMGE import RepositorioMGE
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+T = TypeVar("T")
+
+ClaveIdentidad = tuple[type, str | None, int | str]
+
+
+def clave_identidad(entidad) -> ClaveIdentidad:
+    """Identidad de una entidad del MGE: (tipo, proceso electoral, id)."""
+    if isinstance(entidad, EntidadFederativa):
+        return EntidadFederativa, None, entidad.entidad
+    if isinstance(entidad, ProcesoElectoral):
+        return ProcesoElectoral, None, entidad.id
+    return type(entidad), str(entidad.proceso_electoral_id), entidad.id
+
+
+def _internar(entidad: T) -> T:
+    """Reemplaza los textos de la entidad por su versión internada."""
+    cambios = {}
+    for campo in fields(entidad):
+        valor = getattr(entidad, campo.name)
+        if type(valor) is str:
+            internado = sys.intern(valor)
+            if internado is not valor:
+                cambios[campo.name] = internado
+    return replace(entidad, **cambios) if cambios else entidad
+
+
+class MapaIdentidadMGE:
+    """
+    Mapa de identidad de las entidades del MGE.
+
+    Garantiza una sola instancia canónica por (tipo, proceso electoral, id):
+    cargar la misma entidad para distintos expedientes devuelve el mismo
+    objeto, lo que ahorra memoria y textos duplicados. Las instancias se
+    guardan con referencias débiles, así que se liberan cuando ningún
+    expediente las usa.
+
+    Canonizar no abarata el hash: las entidades son dataclasses congeladas y
+    `hash` recorre todos sus campos en cada búsqueda. Para indexar muchas
+    entidades en conjuntos o diccionarios, use `clave_identidad` como llave.
+    """
+
+    def __init__(self) -> None:
+        self._instancias: weakref.WeakValueDictionary[ClaveIdentidad, object] = (
+            weakref.WeakValueDictionary()
+        )
+        self.aciertos = 0
+        self.altas = 0
+
+    def canonico(self, entidad: T) -> T:
+        """Devuelve la instancia canónica equivalente a `entidad`."""
+        clave = clave_identidad(entidad)
+        existente = self._instancias.get(clave)
+        if existente is not None and (existente is entidad or existente == entidad):
+            self.aciertos += 1
+            return existente
+        # Entidad nueva, o con datos distintos a los conocidos: la nueva manda
+        instancia = _internar(entidad)
+        self._instancias[clave] = instancia
+        self.altas += 1
+        return instancia
+
+    def canonicos(self, entidades: Iterable[T]) -> Iterator[T]:
+        for entidad in entidades:
+            yield self.canonico(entidad)
+
+    def obtener(self, tipo: type[T], proceso_id: str | None, id_: int | str) -> T | None:
+        return self._instancias.get((tipo, proceso_id, id_))
+
+    def descartar_proceso(self, proceso_id: str) -> None:
+        """Olvida todas las instancias de un proceso electoral."""
+        for clave in [clave for clave in self._instancias.keys() if clave[1] == proceso_id]:
+            self._instancias.pop(clave, None)
+
+    def __len__(self) -> int:
+        return len(self._instancias)
+
+
+class RepositorioMGECanonico:
+    """
+    RepositorioMGE que entrega siempre las instancias canónicas del mapa.
+
+    Al serializarse (p. ej. para enviarlo a otro proceso) viaja sólo el
+    repositorio envuelto: el mapa guarda referencias débiles, que no se
+    pueden serializar, y del otro lado se arma uno nuevo y vacío.
+    """
+
+    def __init__(self, repositorio: RepositorioMGE, mapa: MapaIdentidadMGE | None = None) -> None:
+        self._repositorio = repositorio
+        self.mapa = mapa if mapa is not None else MapaIdentidadMGE()
+
+    def __reduce__(self):
+        return type(self), (self._repositorio,)
+
+    def obtener_proceso(self, proceso_id: str) -> ProcesoElectoral:
+        return self.mapa.canonico(self._repositorio.obtener_proceso(proceso_id))
+
+    def iterar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        entidad_id: int | None = None,
+    ) -> Iterator[T]:
+        return self.mapa.canonicos(self._repositorio.iterar(tipo, proceso_id, entidad_id))
+
+    def buscar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        campos: tuple[str, ...],
+        claves: Collection[tuple],
+    ) -> Iterator[T]:
+        return self.mapa.canonicos(self._repositorio.buscar(tipo, proceso_id, campos, claves))
@@ -0,0 +1,75 @@
+from collections.abc import Collection, Iterable, Iterator
+from typing import Protocol, TypeVar
+
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.LimiteLocalidad import LimiteLocalidad
+from newbrain.mge.domain.entities.LocalidadPuntual import LocalidadPuntual
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+T = TypeVar("T")
+
+# Niveles del MGE en el orden en que se recorren (de lo general a lo particular).
+# EntidadFederativa no pertenece a un proceso electoral: es un catálogo fijo.
+TIPOS_MGE: dict[str, type] = {
+    "entidad": EntidadFederativa,
+    "distrito_electoral_federal": DistritoElectoralFederal,
+    "distrito_electoral_local": DistritoElectoralLocal,
+    "municipio": Municipio,
+    "seccion": SeccionElectoral,
+    "limite_localidad": LimiteLocalidad,
+    "localidad_puntual": LocalidadPuntual,
+    "manzana": Manzana,
+}
+
+
+class RepositorioMGE(Protocol):
+    """
+    Puerto de lectura del Marco Geográfico Electoral.
+
+    Los casos de uso dependen de este contrato y no de una tecnología de
+    persistencia. Las implementaciones deben entregar los registros como
+    generadores para que el consumo sea en memoria constante.
+    """
+
+    def obtener_proceso(self, proceso_id: str) -> ProcesoElectoral: ...
+
+    def iterar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        entidad_id: int | None = None,
+    ) -> Iterator[T]:
+        """Recorre los registros de un tipo para el proceso (y entidad, si se indica)."""
+        ...
+
+    def buscar(
+        self,
+        tipo: type[T],
+        proceso_id: str,
+        campos: tuple[str, ...],
+        claves: Collection[tuple],
+    ) -> Iterator[T]:
+        """
+        Consulta masiva: registros cuyos valores en `campos` estén en `claves`.
+
+        Equivale a un `WHERE (campos) IN (claves)`; permite resolver en una
+        sola consulta lo que de otro modo serían N búsquedas individuales.
+        """
+        ...
+
+
+class AlmacenMGE(RepositorioMGE, Protocol):
+    """
+    Puerto de escritura del MGE, usado por la ingesta.
+
+    `guardar` inserta o reemplaza por id; `eliminar` ignora ids inexistentes.
+    """
+
+    def guardar(self, registros: Iterable) -> None: ...
+
+    def eliminar(self, tipo: type, proceso_id: str, ids: Iterable[int]) -> None: ...
@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from newbrain.mge.application.CacheExpedientes import CacheExpedientes
+from newbrain.mge.application.ConstructorExpedientes import (
+    ConstructorExpedientes,
+    SolicitudExpediente,
+)
+from newbrain.mge.domain.aggregates import ExpedienteMGE
+
+ConstruirExpediente = Callable[[SolicitudExpediente], Awaitable[ExpedienteMGE]]
+
+
+@dataclass
+class MetricasVueloUnico:
+    """Contadores acumulados de la capa de coalescencia."""
+
+    solicitudes: int = 0
+    aciertos_cache: int = 0
+    construcciones: int = 0
+    coalescidas: int = 0
+    errores: int = 0
+    en_vuelo: int = 0
+
+
+class VueloUnicoExpedientes:
+    """
+    Coalescencia de construcciones concurrentes de ExpedienteMGE.
+
+    Mientras un expediente se construye, las solicitudes idénticas que llegan
+    esperan esa misma construcción en lugar de iniciar otra; al terminar, el
+    resultado (o el error) se entrega a todas. Si quien inició la construcción
+    se cancela, la construcción continúa para los demás. Con una caché, los
+    expedientes ya construidos (o precalculados) se entregan sin construir.
+    """
+
+    def __init__(
+        self, construir: ConstruirExpediente, cache: CacheExpedientes | None = None
+    ) -> None:
+        self._construir = construir
+        self._cache = cache
+        self._en_vuelo: dict[SolicitudExpediente, asyncio.Task[ExpedienteMGE]] = {}
+        self.metricas = MetricasVueloUnico()
+
+    @classmethod
+    def desde_constructor(
+        cls, constructor: ConstructorExpedientes, cache: CacheExpedientes | None = None
+    ) -> "VueloUnicoExpedientes":
+        """Ejecuta el constructor síncrono en un hilo para no bloquear el event loop."""
+
+        async def construir(solicitud: SolicitudExpediente) -> ExpedienteMGE:
+            return await asyncio.to_thread(constructor.construir, solicitud)
+
+        return cls(construir, cache)
+
+    async def obtener(self, solicitud: SolicitudExpediente) -> ExpedienteMGE:
+        self.metricas.solicitudes += 1
+        if self._cache is not None:
+            expediente = self._cache.obtener(solicitud)
+            if expediente is not None:
+                self.metricas.aciertos_cache += 1
+                return expediente
+        tarea = self._en_vuelo.get(solicitud)
+        if tarea is not None:
+            self.metricas.coalescidas += 1
+        else:
+            tarea = asyncio.ensure_future(self._construir_y_contar(solicitud))
+            self._en_vuelo[solicitud] = tarea
+            self.metricas.en_vuelo = len(self._en_vuelo)
+            tarea.add_done_callback(lambda t: self._terminar(solicitud, t))
+        return await asyncio.shield(tarea)
+
+    async def _construir_y_contar(self, solicitud: SolicitudExpediente) -> ExpedienteMGE:
+        self.metricas.construcciones += 1
+        try:
+            expediente = await self._construir(solicitud)
+        except Exception:
+            self.metricas.errores += 1
+            raise
+        if self._cache is not None:
+            self._cache.guardar(solicitud, expediente)
+        return expediente
+
+    def _terminar(self, solicitud: SolicitudExpediente, tarea: asyncio.Task) -> None:
+        self._en_vuelo.pop(solicitud, None)
+        self.metricas.en_vuelo = len(self._en_vuelo)
+        if not tarea.cancelled():
+            # Marca la excepción como recuperada aunque ya nadie la espere
+            tarea.exception()
@@ -0,0 +1,176 @@
+from dataclasses import dataclass
+from typing import Literal, get_args
+
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.LimiteLocalidad import LimiteLocalidad
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+NivelGeoElectoral = Literal[
+    "entidad",
+    "distrito_electoral_federal",
+    "distrito_electoral_local",
+    "municipio",
+    "seccion",
+]
+
+
+class InconsistenciaExpedienteMGE(ValueError):
+    """Las piezas de un expediente no forman un recorte válido del MGE."""
+
+
+@dataclass(frozen=True)
+class ExpedienteMGE:
+    """
+    Vista consolidada de una unidad geoelectoral para un proceso electoral.
+
+    Reúne la entidad, los distritos, municipios, secciones, localidades y
+    manzanas que describen la unidad del nivel indicado. Sólo se construye
+    mediante `crear`, que verifica que todas las piezas pertenezcan al mismo
+    proceso y entidad, y que respeten las reglas de adscripción del nivel.
+    """
+
+    proceso: ProcesoElectoral
+    entidad: EntidadFederativa
+    nivel: NivelGeoElectoral
+    distritos_federales: tuple[DistritoElectoralFederal, ...] = ()
+    distritos_locales: tuple[DistritoElectoralLocal, ...] = ()
+    municipios: tuple[Municipio, ...] = ()
+    secciones: tuple[SeccionElectoral, ...] = ()
+    localidades: tuple[LimiteLocalidad, ...] = ()
+    manzanas: tuple[Manzana, ...] = ()
+
+    @classmethod
+    def crear(
+        cls,
+        proceso: ProcesoElectoral,
+        entidad: EntidadFederativa,
+        nivel: NivelGeoElectoral,
+        distritos_federales=(),
+        distritos_locales=(),
+        municipios=(),
+        secciones=(),
+        manzanas=(),
+        localidades=(),
+    ) -> "ExpedienteMGE":
+        expediente = cls(
+            proceso=proceso,
+            entidad=entidad,
+            nivel=nivel,
+            distritos_federales=tuple(distritos_federales),
+            distritos_locales=tuple(distritos_locales),
+            municipios=tuple(municipios),
+            secciones=tuple(secciones),
+            localidades=tuple(localidades),
+            manzanas=tuple(manzanas),
+        )
+        expediente._validar()
+        return expediente
+
+    def _validar(self) -> None:
+        if self.nivel not in get_args(NivelGeoElectoral):
+            raise InconsistenciaExpedienteMGE(f"Nivel desconocido: {self.nivel}")
+
+        for pieza in (
+            *self.distritos_federales,
+            *self.distritos_locales,
+            *self.municipios,
+            *self.secciones,
+            *self.localidades,
+            *self.manzanas,
+        ):
+            if pieza.proceso_electoral_id != self.proceso.id:
+                raise InconsistenciaExpedienteMGE(
+                    f"{type(pieza).__name__} {pieza} no pertenece al proceso {self.proceso.id}"
+                )
+            if pieza.entidad_id != self.entidad.entidad:
+                raise InconsistenciaExpedienteMGE(
+                    f"{type(pieza).__name__} {pieza} no pertenece a la entidad {self.entidad}"
+                )
+
+        validar_nivel = getattr(self, f"_validar_{self.nivel}")
+        validar_nivel()
+
+    def _validar_entidad(self) -> None:
+        # A nivel entidad, distritos y municipios funcionan como catálogo
+        pass
+
+    def _validar_distrito_electoral_federal(self) -> None:
+        distrito = self._unico(self.distritos_federales, "distrito electoral federal")
+        if self.distritos_locales or self.municipios:
+            raise InconsistenciaExpedienteMGE(
+                "Un expediente distrital federal no admite distritos locales ni municipios"
+            )
+        for seccion in self.secciones:
+            if seccion.distrito_electoral_federal_id != distrito.id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no está adscrita al distrito federal {distrito}"
+                )
+
+    def _validar_distrito_electoral_local(self) -> None:
+        distrito = self._unico(self.distritos_locales, "distrito electoral local")
+        if self.distritos_federales or self.municipios:
+            raise InconsistenciaExpedienteMGE(
+                "Un expediente distrital local no admite distritos federales ni municipios"
+            )
+        for seccion in self.secciones:
+            if seccion.distrito_electoral_local_id != distrito.id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no está adscrita al distrito local {distrito}"
+                )
+
+    def _validar_municipio(self) -> None:
+        municipio = self._unico(self.municipios, "municipio")
+        if self.distritos_federales and self.distritos_locales:
+            raise InconsistenciaExpedienteMGE(
+                "Un expediente municipal no admite distritos federales y locales a la vez"
+            )
+        for seccion in self.secciones:
+            if seccion.municipio_id != municipio.municipio_id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no pertenece al municipio {municipio}"
+                )
+
+    def _validar_seccion(self) -> None:
+        seccion = self._unico(self.secciones, "sección")
+        if len(self.distritos_federales) > 1 or len(self.distritos_locales) > 1:
+            raise InconsistenciaExpedienteMGE("Una sección pertenece a un solo distrito")
+        if len(self.municipios) > 1:
+            raise InconsistenciaExpedienteMGE("Una sección pertenece a un solo municipio")
+        for distrito in self.distritos_federales:
+            if seccion.distrito_electoral_federal_id != distrito.id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no está adscrita al distrito federal {distrito}"
+                )
+        for distrito in self.distritos_locales:
+            if seccion.distrito_electoral_local_id != distrito.id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no está adscrita al distrito local {distrito}"
+                )
+        for municipio in self.municipios:
+            if seccion.municipio_id != municipio.municipio_id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La sección {seccion} no pertenece al municipio {municipio}"
+                )
+        for localidad in self.localidades:
+            if localidad.municipio_id != seccion.municipio_id:
+                raise InconsistenciaExpedienteMGE(
+                    f"La localidad {localidad} no está en el municipio de la sección {seccion}"
+                )
+        for manzana in self.manzanas:
+            if manzana.seccion_id != seccion.seccion:
+                raise InconsistenciaExpedienteMGE(
+                    f"La manzana {manzana} no pertenece a la sección {seccion}"
+                )
+
+    @staticmethod
+    def _unico(piezas: tuple, descripcion: str):
+        if len(piezas) != 1:
+            raise InconsistenciaExpedienteMGE(
+                f"El expediente requiere exactamente un(a) {descripcion}, recibió {len(piezas)}"
+            )
+        return piezas[0]
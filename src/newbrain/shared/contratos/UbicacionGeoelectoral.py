@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from typing import Literal
+
+NivelAgregacion = Literal["seccion", "municipio", "distrito_electoral_federal", "entidad"]
+
+# De lo particular a lo general
+NIVELES_AGREGACION: tuple[NivelAgregacion, ...] = (
+    "seccion",
+    "municipio",
+    "distrito_electoral_federal",
+    "entidad",
+)
+
+
+@dataclass(frozen=True)
+class UbicacionGeoelectoral:
+    """
+    Contrato entre dominios para referirse a una sección del MGE.
+
+    Los dominios que registran información por sección (KPI, VOZMAC) no
+    importan las entidades del MGE: guardan estas claves y las usan para
+    agregar a lo largo de la jerarquía sección → municipio → distrito → entidad.
+    """
+
+    proceso_electoral_id: str
+    entidad: int
+    distrito_electoral_federal: int
+    municipio: int
+    seccion: int
+
+    def unidad(self, nivel: NivelAgregacion) -> tuple[int, ...]:
+        """Clave de la unidad que contiene a la sección en el nivel indicado."""
+        if nivel == "entidad":
+            return (self.entidad,)
+        return (self.entidad, getattr(self, nivel))
+
+    def __str__(self) -> str:
+        return f"{self.entidad:02d} {self.seccion:04d}"
@@ -0,0 +1,164 @@
+import asyncio
+import json
+import logging
+import sqlite3
+from pathlib import Path
+
+from newbrain.shared.eventos.BusEventos import BusEventos
+from newbrain.shared.eventos.EventoContrato import EventoContrato
+
+logger = logging.getLogger(__name__)
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS bandeja_salida (
+    posicion INTEGER PRIMARY KEY AUTOINCREMENT,
+    id_evento TEXT NOT NULL UNIQUE,
+    nombre TEXT NOT NULL,
+    datos TEXT NOT NULL,
+    entregado INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class BandejaSalida:
+    """
+    Bandeja de salida transaccional (outbox) sobre la base de datos local.
+
+    Es el lado de escritura: un dominio registra sus eventos con su propia
+    conexión y dentro de la misma transacción que sus cambios, así que o se
+    confirman ambos o ninguno. La entrega corre a cargo de un
+    RetransmisorBandeja, con otra conexión, fuera del camino de la solicitud.
+    """
+
+    def __init__(self, conexion: sqlite3.Connection) -> None:
+        self._conexion = conexion
+        # Sin `with`: crear la tabla no debe confirmar la transacción del llamador
+        conexion.execute(_ESQUEMA)
+
+    def registrar(self, evento: EventoContrato) -> None:
+        """Agrega el evento a la transacción abierta; no la confirma."""
+        self._conexion.execute(
+            "INSERT INTO bandeja_salida (id_evento, nombre, datos) VALUES (?, ?, ?)",
+            (evento.id_evento, evento.nombre, json.dumps(evento.a_dict())),
+        )
+
+
+class RetransmisorBandeja:
+    """
+    Publica en el bus los eventos pendientes de la bandeja, en orden.
+
+    Abre su propia conexión a la base de datos (que debe ser un archivo):
+    sólo ve eventos de transacciones confirmadas, y sus escrituras nunca
+    confirman la transacción abierta de un dominio. Las consultas corren en
+    un hilo aparte para no bloquear el event loop.
+
+    Un evento se marca entregado cuando todos sus suscriptores acusan el
+    lote. Si algún acuse no llega en `espera_acuse` segundos, el evento no
+    se vuelve a publicar mientras siga en vuelo: se marca cuando el acuse
+    llega, en una vuelta posterior. Si algún suscriptor falla, el evento
+    queda pendiente y se reintenta. La entrega sobrevive a reinicios y es al
+    menos una vez: un manejador puede recibir un evento repetido.
+    """
+
+    def __init__(
+        self,
+        ruta_base: str | Path,
+        bus: BusEventos,
+        intervalo: float = 0.5,
+        lote: int = 100,
+        espera_acuse: float = 30.0,
+    ) -> None:
+        # La conexión se usa desde hilos de `asyncio.to_thread`, nunca dos a la vez
+        self._conexion = sqlite3.connect(ruta_base, check_same_thread=False)
+        with self._conexion:
+            self._conexion.execute(_ESQUEMA)
+        self._bus = bus
+        self._intervalo = intervalo
+        self._lote = lote
+        self._espera_acuse = espera_acuse
+        self._en_vuelo: dict[int, list[asyncio.Future[bool]]] = {}
+        self._candado = asyncio.Lock()
+
+    @property
+    def en_vuelo(self) -> int:
+        """Eventos publicados cuyos acuses aún no llegan."""
+        return len(self._en_vuelo)
+
+    def pendientes(
+        self, limite: int = 100, despues_de: int = 0
+    ) -> list[tuple[int, EventoContrato]]:
+        filas = self._conexion.execute(
+            "SELECT posicion, nombre, datos FROM bandeja_salida "
+            "WHERE entregado = 0 AND posicion > ? ORDER BY posicion LIMIT ?",
+            (despues_de, limite),
+        ).fetchall()
+        return [
+            (posicion, EventoContrato.desde_dict(nombre, json.loads(datos)))
+            for posicion, nombre, datos in filas
+        ]
+
+    def marcar_entregados(self, posiciones: list[int]) -> None:
+        with self._conexion:
+            self._conexion.executemany(
+                "UPDATE bandeja_salida SET entregado = 1 WHERE posicion = ?",
+                [(posicion,) for posicion in posiciones],
+            )
+
+    def purgar_entregados(self) -> int:
+        with self._conexion:
+            return self._conexion.execute("DELETE FROM bandeja_salida WHERE entregado = 1").rowcount
+
+    async def retransmitir(self) -> int:
+        """
+        Recorre una vez lo pendiente y publica lo que no está en vuelo.
+
+        Devuelve cuántos eventos quedaron marcados como entregados, incluidos
+        los de vueltas anteriores cuyo acuse llegó tarde.
+        """
+        async with self._candado:
+            total = await self._marcar(self._resolver(list(self._en_vuelo)))
+            ultima = 0
+            while pendientes := await asyncio.to_thread(self.pendientes, self._lote, ultima):
+                ultima = pendientes[-1][0]
+                publicadas = []
+                for posicion, evento in pendientes:
+                    if posicion not in self._en_vuelo:
+                        self._en_vuelo[posicion] = await self._bus.publicar_con_acuse(evento)
+                        publicadas.append(posicion)
+                esperados = [a for posicion in publicadas for a in self._en_vuelo[posicion]]
+                if esperados:
+                    await asyncio.wait(esperados, timeout=self._espera_acuse)
+                total += await self._marcar(self._resolver(publicadas))
+            return total
+
+    async def ejecutar(self) -> None:
+        """Ciclo de retransmisión; termina al cancelar la tarea."""
+        while True:
+            try:
+                await self.retransmitir()
+            except Exception:
+                logger.exception("Falló la retransmisión de la bandeja de salida")
+            await asyncio.sleep(self._intervalo)
+
+    def cerrar(self) -> None:
+        self._conexion.close()
+
+    def _resolver(self, posiciones: list[int]) -> list[int]:
+        """
+        Saca de vuelo los eventos cuyos acuses ya llegaron y devuelve los
+        entregados; los que fallaron quedan pendientes para reintentarse.
+        """
+        entregados = []
+        for posicion in posiciones:
+            acuses = self._en_vuelo[posicion]
+            if not all(acuse.done() for acuse in acuses):
+                continue
+            del self._en_vuelo[posicion]
+            if all(acuse.result() for acuse in acuses):
+                entregados.append(posicion)
+        return entregados
+
+    async def _marcar(self, posiciones: list[int]) -> int:
+        if posiciones:
+            await asyncio.to_thread(self.marcar_entregados, posiciones)
+        return len(posiciones)
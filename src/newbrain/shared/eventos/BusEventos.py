@@ -0,0 +1,183 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from newbrain.shared.eventos.EventoContrato import EventoContrato
+
+E = TypeVar("E", bound=EventoContrato)
+
+Manejador = Callable[[list[E]], Awaitable[None]]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MetricasSuscripcion:
+    recibidos: int = 0
+    lotes: int = 0
+    entregados: int = 0
+    fallidos: int = 0
+
+
+class Suscripcion(Generic[E]):
+    """
+    Suscriptor del bus: una cola acotada y una tarea que la consume en lotes.
+
+    Cuando la cola se llena, `publicar` espera: un suscriptor lento frena a
+    quien publica en lugar de acumular memoria sin límite. Cada evento puede
+    llevar un acuse, un futuro que se resuelve al terminar su lote: True si
+    el manejador lo procesó, False si falló o la suscripción se detuvo antes.
+    """
+
+    def __init__(
+        self,
+        nombre: str,
+        tipo: type[E],
+        manejador: Manejador,
+        capacidad: int,
+        tamano_lote: int,
+        espera_lote: float,
+    ) -> None:
+        self.nombre = nombre
+        self.tipo = tipo
+        self.metricas = MetricasSuscripcion()
+        self._manejador = manejador
+        self._cola: asyncio.Queue[tuple[E, asyncio.Future[bool] | None]] = asyncio.Queue(
+            maxsize=capacidad
+        )
+        self._tamano_lote = tamano_lote
+        self._espera_lote = espera_lote
+        self._tarea: asyncio.Task | None = None
+
+    @property
+    def pendientes(self) -> int:
+        return self._cola.qsize()
+
+    async def encolar(self, evento: E, acuse: asyncio.Future[bool] | None = None) -> None:
+        await self._cola.put((evento, acuse))
+        self.metricas.recibidos += 1
+
+    def iniciar(self) -> None:
+        if self._tarea is None:
+            self._tarea = asyncio.create_task(self._consumir(), name=f"bus:{self.nombre}")
+
+    async def detener(self, drenar: bool = True) -> None:
+        # Sin tarea nadie consume la cola: esperar a vaciarla no terminaría nunca
+        if drenar and self._tarea is not None:
+            await self._cola.join()
+        if self._tarea is not None:
+            self._tarea.cancel()
+            await asyncio.gather(self._tarea, return_exceptions=True)
+            self._tarea = None
+        # Lo que quedó sin procesar se acusa como no entregado
+        while not self._cola.empty():
+            elemento = self._cola.get_nowait()
+            _acusar([elemento], False)
+            self._cola.task_done()
+
+    async def _consumir(self) -> None:
+        while True:
+            lote = [await self._cola.get()]
+            limite = asyncio.get_running_loop().time() + self._espera_lote
+            while len(lote) < self._tamano_lote:
+                restante = limite - asyncio.get_running_loop().time()
+                if restante <= 0:
+                    break
+                try:
+                    lote.append(await asyncio.wait_for(self._cola.get(), restante))
+                except TimeoutError:
+                    break
+            entregado = False
+            try:
+                await self._manejador([evento for evento, _ in lote])
+                entregado = True
+                self.metricas.entregados += len(lote)
+            except Exception:
+                self.metricas.fallidos += len(lote)
+                logger.exception("El suscriptor %s falló con un lote de %d", self.nombre, len(lote))
+            finally:
+                self.metricas.lotes += 1
+                _acusar(lote, entregado)
+                for _ in lote:
+                    self._cola.task_done()
+
+
+def _acusar(lote: list[tuple[E, asyncio.Future[bool] | None]], entregado: bool) -> None:
+    for _, acuse in lote:
+        if acuse is not None and not acuse.done():
+            acuse.set_result(entregado)
+
+
+class BusEventos:
+    """
+    Bus de eventos en proceso entre dominios.
+
+    Publicar sólo encola: los manejadores corren en tareas propias y reciben
+    los eventos en lotes (hasta `tamano_lote`, o lo acumulado en
+    `espera_lote` segundos), fuera del camino de la solicitud. Para que un
+    evento sobreviva a un reinicio, debe pasar por la BandejaSalida.
+    """
+
+    def __init__(
+        self, capacidad: int = 1_000, tamano_lote: int = 100, espera_lote: float = 0.05
+    ) -> None:
+        self._capacidad = capacidad
+        self._tamano_lote = tamano_lote
+        self._espera_lote = espera_lote
+        self._suscripciones: list[Suscripcion] = []
+        self._iniciado = False
+
+    def suscribir(
+        self,
+        tipo: type[E],
+        manejador: Manejador,
+        nombre: str | None = None,
+        capacidad: int | None = None,
+    ) -> Suscripcion[E]:
+        suscripcion = Suscripcion(
+            nombre or getattr(manejador, "__qualname__", repr(manejador)),
+            tipo,
+            manejador,
+            capacidad or self._capacidad,
+            self._tamano_lote,
+            self._espera_lote,
+        )
+        self._suscripciones.append(suscripcion)
+        if self._iniciado:
+            suscripcion.iniciar()
+        return suscripcion
+
+    async def publicar(self, evento: EventoContrato) -> int:
+        """Entrega el evento a las colas de sus suscriptores; devuelve cuántos son."""
+        destinos = self._destinos(evento)
+        for suscripcion in destinos:
+            await suscripcion.encolar(evento)
+        return len(destinos)
+
+    async def publicar_con_acuse(self, evento: EventoContrato) -> list[asyncio.Future[bool]]:
+        """
+        Como `publicar`, pero devuelve un acuse por suscriptor: un futuro que
+        se resuelve cuando su manejador termina con el lote del evento.
+        """
+        loop = asyncio.get_running_loop()
+        acuses = []
+        for suscripcion in self._destinos(evento):
+            acuse = loop.create_future()
+            await suscripcion.encolar(evento, acuse)
+            acuses.append(acuse)
+        return acuses
+
+    def iniciar(self) -> None:
+        self._iniciado = True
+        for suscripcion in self._suscripciones:
+            suscripcion.iniciar()
+
+    async def detener(self, drenar: bool = True) -> None:
+        """Detiene a los suscriptores; con `drenar`, después de vaciar sus colas."""
+        self._iniciado = False
+        await asyncio.gather(*(s.detener(drenar) for s in self._suscripciones))
+
+    def _destinos(self, evento: EventoContrato) -> list[Suscripcion]:
+        return [s for s in self._suscripciones if isinstance(evento, s.tipo)]
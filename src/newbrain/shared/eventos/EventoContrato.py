@@ -0,0 +1,53 @@
+import uuid
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from typing import Any, ClassVar
+
+_REGISTRO: dict[str, type["EventoContrato"]] = {}
+
+
+@dataclass(frozen=True, kw_only=True)
+class EventoContrato:
+    """
+    Base de los eventos con los que se comunican los dominios.
+
+    Cada evento concreto es una dataclass congelada con un `nombre` estable
+    (p. ej. "kpi.alerta_emitida"); el nombre, y no la clase, es el contrato
+    que se persiste en la bandeja de salida. Los campos deben ser de tipos
+    simples: str, int, float, bool, date o datetime.
+    """
+
+    nombre: ClassVar[str]
+
+    id_evento: str = field(default_factory=lambda: uuid.uuid4().hex)
+    ocurrido: datetime = field(default_factory=datetime.now)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        nombre = cls.__dict__.get("nombre")
+        if nombre is not None:
+            if nombre in _REGISTRO and _REGISTRO[nombre] is not cls:
+                raise TypeError(f"Nombre de evento duplicado: {nombre}")
+            _REGISTRO[nombre] = cls
+
+    def a_dict(self) -> dict[str, Any]:
+        datos = {}
+        for campo in fields(self):
+            valor = getattr(self, campo.name)
+            datos[campo.name] = valor.isoformat() if isinstance(valor, date) else valor
+        return datos
+
+    @classmethod
+    def desde_dict(cls, nombre: str, datos: dict[str, Any]) -> "EventoContrato":
+        tipo = _REGISTRO.get(nombre)
+        if tipo is None:
+            raise LookupError(f"Evento no registrado: {nombre}")
+        valores = {}
+        for campo in fields(tipo):
+            valor = datos[campo.name]
+            if campo.type in (datetime, "datetime"):
+                valor = datetime.fromisoformat(valor)
+            elif campo.type in (date, "date"):
+                valor = date.fromisoformat(valor)
+            valores[campo.name] = valor
+        return tipo(**valores)
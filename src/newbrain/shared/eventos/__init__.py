@@ -0,0 +1,11 @@
+from .BandejaSalida import BandejaSalida, RetransmisorBandeja
+from .BusEventos import BusEventos, Suscripcion
+from .EventoContrato import EventoContrato
+
+__all__ = [
+    "BandejaSalida",
+    "BusEventos",
+    "EventoContrato",
+    "RetransmisorBandeja",
+    "Suscripcion",
+]
@@ -0,0 +1,230 @@
+from array import array
+from collections.abc import Iterable, Iterator
+
+from newbrain.shared.contratos.UbicacionGeoelectoral import (
+    NIVELES_AGREGACION,
+    NivelAgregacion,
+    UbicacionGeoelectoral,
+)
+from newbrain.vozmac.domain.entities.Encuesta import Encuesta
+from newbrain.vozmac.domain.entities.Respuesta import Respuesta
+from newbrain.vozmac.domain.value_objects.EstadisticasLikert import EstadisticasLikert
+
+# Recorte que abarca todo el proceso electoral
+NIVEL_PROCESO = "proceso"
+
+
+def _productos_cruzados(valores: tuple[int, ...]) -> list[int]:
+    """Productos x_i·x_j (i ≤ j) de una respuesta, en orden de la matriz triangular."""
+    k = len(valores)
+    return [valores[i] * valores[j] for i in range(k) for j in range(i, k)]
+
+
+def _forma(encuesta: Encuesta) -> tuple[int, int]:
+    return len(encuesta.reactivos), encuesta.escala
+
+
+class _Suficientes:
+    """
+    Estadísticos suficientes de un recorte, actualizables respuesta a respuesta.
+
+    Con los conteos por opción, las sumas y la matriz de productos cruzados
+    (triangular superior) se obtienen distribución, medias, varianzas y
+    covarianzas sin volver a leer las respuestas. Todo es entero, así que la
+    acumulación es exacta.
+    """
+
+    __slots__ = ("k", "escala", "n", "conteos", "sumas", "productos")
+
+    def __init__(self, k: int, escala: int) -> None:
+        self.k = k
+        self.escala = escala
+        self.n = 0
+        self.conteos = array("q", bytes(8 * k * escala))
+        self.sumas = array("q", bytes(8 * k))
+        self.productos = array("q", bytes(8 * (k * (k + 1) // 2)))
+
+    def agregar(self, valores: tuple[int, ...], productos: list[int]) -> None:
+        escala = self.escala
+        self.n += 1
+        for i, x in enumerate(valores):
+            self.conteos[i * escala + x - 1] += 1
+            self.sumas[i] += x
+        acumulados = self.productos
+        for posicion, producto in enumerate(productos):
+            acumulados[posicion] += producto
+
+    def covarianza(self, i: int, j: int) -> float:
+        if i > j:
+            i, j = j, i
+        n = self.n
+        posicion = i * self.k - i * (i - 1) // 2 + (j - i)
+        return (self.productos[posicion] - self.sumas[i] * self.sumas[j] / n) / (n - 1)
+
+    def estadisticas(self) -> EstadisticasLikert:
+        k, escala, n = self.k, self.escala, self.n
+        distribucion = tuple(tuple(self.conteos[i * escala : (i + 1) * escala]) for i in range(k))
+        medias = tuple(self.sumas[i] / n if n else 0.0 for i in range(k))
+        return EstadisticasLikert(n, distribucion, medias, self._alfa())
+
+    def _alfa(self) -> float | None:
+        k = self.k
+        if k < 2 or self.n < 2:
+            return None
+        varianzas = sum(self.covarianza(i, i) for i in range(k))
+        total = sum(self.covarianza(i, j) for i in range(k) for j in range(k))
+        if total == 0:
+            return None
+        return k / (k - 1) * (1 - varianzas / total)
+
+
+class _Columnas:
+    """
+    Respuestas crudas de una encuesta, guardadas por columnas.
+
+    Los valores van en enteros de un byte, k por respuesta; en paralelo se
+    guardan las claves de la sección y el proceso electoral (como índice a
+    un catálogo), de modo que las respuestas pueden volver a recortarse.
+    """
+
+    def __init__(self, encuesta_id: str, k: int) -> None:
+        self.encuesta_id = encuesta_id
+        self.k = k
+        self.valores = array("B")
+        self.procesos: list[str] = []
+        self._indice_proceso: dict[str, int] = {}
+        self.proceso = array("H")
+        self.entidades = array("H")
+        self.distritos = array("H")
+        self.municipios = array("H")
+        self.secciones = array("H")
+
+    def __len__(self) -> int:
+        return len(self.proceso)
+
+    def agregar(self, respuesta: Respuesta) -> None:
+        ubicacion = respuesta.ubicacion
+        indice = self._indice_proceso.get(ubicacion.proceso_electoral_id)
+        if indice is None:
+            indice = self._indice_proceso[ubicacion.proceso_electoral_id] = len(self.procesos)
+            self.procesos.append(ubicacion.proceso_electoral_id)
+        self.valores.extend(respuesta.valores)
+        self.proceso.append(indice)
+        self.entidades.append(ubicacion.entidad)
+        self.distritos.append(ubicacion.distrito_electoral_federal)
+        self.municipios.append(ubicacion.municipio)
+        self.secciones.append(ubicacion.seccion)
+
+    def respuestas(self) -> Iterator[Respuesta]:
+        k = self.k
+        for fila in range(len(self)):
+            yield Respuesta(
+                self.encuesta_id,
+                UbicacionGeoelectoral(
+                    self.procesos[self.proceso[fila]],
+                    self.entidades[fila],
+                    self.distritos[fila],
+                    self.municipios[fila],
+                    self.secciones[fila],
+                ),
+                tuple(self.valores[fila * k : (fila + 1) * k]),
+            )
+
+
+class AnaliticaLikert:
+    """
+    Motor de analítica en flujo para encuestas VOZMAC.
+
+    Las respuestas crudas se guardan por columnas en arreglos compactos por
+    encuesta. Cada respuesta actualiza, en el momento, los estadísticos
+    suficientes del proceso electoral y de cada unidad del MGE que contiene
+    a su sección, de modo que un reporte por recorte cuesta O(k²) y no
+    depende del número de respuestas. Los estadísticos pueden recalcularse
+    a partir de las respuestas crudas con `recalcular`.
+    """
+
+    def __init__(self) -> None:
+        self._encuestas: dict[str, Encuesta] = {}
+        self._columnas: dict[str, _Columnas] = {}
+        self._recortes: dict[tuple, _Suficientes] = {}
+
+    def registrar_encuesta(self, encuesta: Encuesta) -> None:
+        if encuesta.escala > 255:
+            raise ValueError("La escala Likert debe caber en un byte")
+        registrada = self._encuestas.get(encuesta.id)
+        if registrada is None:
+            self._columnas[encuesta.id] = _Columnas(encuesta.id, len(encuesta.reactivos))
+        elif _forma(registrada) != _forma(encuesta):
+            # Las respuestas guardadas dependen del número de reactivos y de la escala
+            raise ValueError(
+                f"La encuesta {encuesta.id} ya está registrada con otros reactivos o escala"
+            )
+        self._encuestas[encuesta.id] = encuesta
+
+    def agregar(self, respuesta: Respuesta) -> None:
+        encuesta = self._encuestas[respuesta.encuesta_id]
+        valores = respuesta.valores
+        if len(valores) != len(encuesta.reactivos):
+            raise ValueError(
+                f"La encuesta {encuesta.id} tiene {len(encuesta.reactivos)} reactivos, "
+                f"la respuesta trae {len(valores)}"
+            )
+        if any(not 1 <= x <= encuesta.escala for x in valores):
+            raise ValueError(f"Valores fuera de la escala 1-{encuesta.escala}: {valores}")
+
+        self._columnas[encuesta.id].agregar(respuesta)
+        self._acumular(encuesta, respuesta)
+
+    def agregar_muchas(self, respuestas: Iterable[Respuesta]) -> None:
+        for respuesta in respuestas:
+            self.agregar(respuesta)
+
+    def estadisticas(
+        self,
+        encuesta_id: str,
+        proceso_id: str,
+        nivel: NivelAgregacion | str = NIVEL_PROCESO,
+        unidad: tuple[int, ...] = (),
+    ) -> EstadisticasLikert:
+        """Estadísticos de la encuesta en un proceso, completo o por unidad del MGE."""
+        recorte = self._recortes.get((encuesta_id, proceso_id, nivel, unidad))
+        if recorte is None:
+            encuesta = self._encuestas[encuesta_id]
+            recorte = _Suficientes(len(encuesta.reactivos), encuesta.escala)
+        return recorte.estadisticas()
+
+    def respuestas(self, encuesta_id: str, proceso_id: str | None = None) -> Iterator[Respuesta]:
+        """Respuestas crudas de la encuesta, en orden de llegada."""
+        for respuesta in self._columnas[encuesta_id].respuestas():
+            if proceso_id is None or respuesta.ubicacion.proceso_electoral_id == proceso_id:
+                yield respuesta
+
+    def recalcular(self, encuesta_id: str) -> None:
+        """Rehace los estadísticos de todos los recortes de la encuesta desde las respuestas."""
+        encuesta = self._encuestas[encuesta_id]
+        for clave in [clave for clave in self._recortes if clave[0] == encuesta_id]:
+            del self._recortes[clave]
+        for respuesta in self._columnas[encuesta_id].respuestas():
+            self._acumular(encuesta, respuesta)
+
+    def total_respuestas(self, encuesta_id: str) -> int:
+        return len(self._columnas[encuesta_id])
+
+    def _acumular(self, encuesta: Encuesta, respuesta: Respuesta) -> None:
+        valores = respuesta.valores
+        # Los productos cruzados son iguales para todos los recortes: se calculan una vez
+        productos = _productos_cruzados(valores)
+        for clave in self._claves(respuesta):
+            recorte = self._recortes.get(clave)
+            if recorte is None:
+                recorte = self._recortes[clave] = _Suficientes(
+                    len(encuesta.reactivos), encuesta.escala
+                )
+            recorte.agregar(valores, productos)
+
+    def _claves(self, respuesta: Respuesta) -> Iterable[tuple]:
+        ubicacion = respuesta.ubicacion
+        base = (respuesta.encuesta_id, ubicacion.proceso_electoral_id)
+        yield (*base, NIVEL_PROCESO, ())
+        for nivel in NIVELES_AGREGACION:
+            yield (*base, nivel, ubicacion.unidad(nivel))
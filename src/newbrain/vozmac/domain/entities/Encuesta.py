@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Encuesta:
+    """
+    Instrumento de medición perceptual con reactivos tipo Likert.
+
+    Todos los reactivos comparten la escala: opciones de 1 a `escala`.
+    """
+
+    id: str
+    nombre: str
+    reactivos: tuple[str, ...]
+    escala: int = 5
+
+    def __str__(self) -> str:
+        return f"{self.id} {self.nombre.upper()}"
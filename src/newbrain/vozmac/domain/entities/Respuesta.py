@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+
+from newbrain.shared.contratos.UbicacionGeoelectoral import UbicacionGeoelectoral
+
+
+@dataclass(frozen=True)
+class Respuesta:
+    """
+    Respuesta completa de una persona a una encuesta.
+
+    `valores` trae una opción por reactivo, en el orden de la encuesta.
+    """
+
+    encuesta_id: str
+    ubicacion: UbicacionGeoelectoral
+    valores: tuple[int, ...]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EstadisticasLikert:
+    """
+    Estadísticos de una encuesta Likert sobre un recorte de respuestas.
+
+    `distribucion[i][o]` es el número de respuestas con la opción `o + 1`
+    en el reactivo `i`.
+    """
+
+    respuestas: int
+    distribucion: tuple[tuple[int, ...], ...]
+    medias: tuple[float, ...]
+    alfa_cronbach: float | None
+
+    def top_box(self, reactivo: int, opciones: int = 1) -> float:
+        """Proporción de respuestas en las `opciones` más altas de la escala."""
+        if not self.respuestas:
+            return 0.0
+        return sum(self.distribucion[reactivo][-opciones:]) / self.respuestas
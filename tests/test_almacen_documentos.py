@@ -0,0 +1,118 @@
+import hashlib
+import io
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from newbrain.docs.adapters.AlmacenDocumentos import AlmacenDocumentos, DocumentoNoEncontrado
+from newbrain.docs.adapters.fragmentacion import TAMANO_MAXIMO, TAMANO_MINIMO, fragmentar
+
+
+def sample_contenido(tamano=300_000, semilla=1):
+    return random.Random(semilla).randbytes(tamano)
+
+
+def test_fragmentos_respetan_limites_y_reconstruyen_el_contenido():
+    contenido = sample_contenido()
+    fragmentos = list(fragmentar(io.BytesIO(contenido)))
+
+    assert b"".join(fragmentos) == contenido
+    assert all(len(f) <= TAMANO_MAXIMO for f in fragmentos)
+    assert all(len(f) >= TAMANO_MINIMO for f in fragmentos[:-1])
+
+
+def test_una_insercion_solo_cambia_fragmentos_cercanos():
+    contenido = sample_contenido()
+    editado = contenido[:150_000] + b"parrafo insertado" + contenido[150_000:]
+
+    originales = set(fragmentar(io.BytesIO(contenido)))
+    nuevos = list(fragmentar(io.BytesIO(editado)))
+
+    assert sum(f not in originales for f in nuevos) <= 2
+
+
+def test_guardar_y_leer_versiones(tmp_path):
+    almacen = AlmacenDocumentos(tmp_path)
+    v1 = sample_contenido()
+    v2 = v1[:100_000] + b"revision 2" + v1[100_000:]
+
+    primera = almacen.guardar("MAN-01", io.BytesIO(v1), "manual.pdf")
+    segunda = almacen.guardar("MAN-01", io.BytesIO(v2), "manual.pdf")
+
+    assert (primera.version, segunda.version) == (1, 2)
+    assert b"".join(almacen.leer("MAN-01", 1)) == v1
+    assert b"".join(almacen.leer("MAN-01")) == v2
+    assert segunda.hash_contenido == hashlib.sha256(v2).hexdigest()
+    assert [v.version for v in almacen.versiones("MAN-01")] == [1, 2]
+    # La segunda versión reutiliza casi todos los fragmentos de la primera
+    assert almacen.bytes_almacenados() < len(v1) + 2 * TAMANO_MAXIMO
+
+
+def test_version_inexistente(tmp_path):
+    almacen = AlmacenDocumentos(tmp_path)
+    with pytest.raises(DocumentoNoEncontrado):
+        almacen.obtener("NO-EXISTE")
+    with pytest.raises(DocumentoNoEncontrado):
+        list(almacen.leer("NO-EXISTE", 3))
+
+
+@pytest.mark.parametrize("documento_id", ["../../escape", "MAN/01", "..", "", ".oculto"])
+def test_identificador_invalido_no_sale_de_la_raiz(tmp_path, documento_id):
+    almacen = AlmacenDocumentos(tmp_path / "raiz")
+    with pytest.raises(ValueError):
+        almacen.guardar(documento_id, io.BytesIO(b"contenido"), "x.txt")
+    with pytest.raises(ValueError):
+        almacen.versiones(documento_id)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["raiz"]
+    assert list((tmp_path / "raiz" / "versiones").iterdir()) == []
+
+
+def test_cargas_simultaneas_no_se_sobrescriben(tmp_path):
+    almacen = AlmacenDocumentos(tmp_path)
+    contenidos = [sample_contenido(20_000, semilla=i) for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as ejecutor:
+        versiones = list(
+            ejecutor.map(
+                lambda contenido: almacen.guardar("MAN-01", io.BytesIO(contenido), "m.pdf"),
+                contenidos,
+            )
+        )
+
+    assert sorted(v.version for v in versiones) == list(range(1, 9))
+    for version, contenido in zip(versiones, contenidos):
+        assert b"".join(almacen.leer("MAN-01", version.version)) == contenido
+
+
+def test_numero_ocupado_toma_el_siguiente(tmp_path, monkeypatch):
+    almacen = AlmacenDocumentos(tmp_path)
+    almacen.guardar("MAN-01", io.BytesIO(b"uno"), "m.pdf")
+    almacen.guardar("MAN-01", io.BytesIO(b"dos"), "m.pdf")
+    # Simula una carga que listó el directorio antes de que se publicara la versión 2
+    monkeypatch.setattr(almacen, "_numeros", lambda documento_id: [1])
+
+    tercera = almacen.guardar("MAN-01", io.BytesIO(b"tres"), "m.pdf")
+
+    monkeypatch.undo()
+    assert tercera.version == 3
+    assert b"".join(almacen.leer("MAN-01", 2)) == b"dos"
+    assert b"".join(almacen.leer("MAN-01", 3)) == b"tres"
+    assert not list((tmp_path / "versiones" / "MAN-01").glob("*.tmp"))
+
+
+def test_obtener_la_ultima_solo_lee_su_manifiesto(tmp_path, monkeypatch):
+    almacen = AlmacenDocumentos(tmp_path)
+    for i in range(5):
+        almacen.guardar("MAN-01", io.BytesIO(f"version {i}".encode()), "m.pdf")
+    leidas = []
+    leer_version = almacen._leer_version
+    monkeypatch.setattr(
+        almacen,
+        "_leer_version",
+        lambda documento_id, version: leidas.append(version) or leer_version(documento_id, version),
+    )
+
+    assert b"".join(almacen.leer("MAN-01")) == b"version 4"
+    assert leidas == [5]
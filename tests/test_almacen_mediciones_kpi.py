@@ -0,0 +1,118 @@
+from datetime import UTC, date, datetime, timedelta
+from zoneinfo import ZoneInfo
+
+from newbrain.kpi.adapters import AlmacenMediciones as modulo_almacen
+from newbrain.kpi.adapters.AlmacenMediciones import AlmacenMediciones, inicio_periodo
+from newbrain.kpi.domain.entities.Medicion import Medicion
+from newbrain.shared.contratos.UbicacionGeoelectoral import UbicacionGeoelectoral
+
+XALAPA_1234 = UbicacionGeoelectoral("2024", 30, 8, 87, 1234)
+XALAPA_1235 = UbicacionGeoelectoral("2024", 30, 8, 87, 1235)
+COATEPEC_1300 = UbicacionGeoelectoral("2024", 30, 9, 38, 1300)
+
+
+def medicion(ubicacion, instante, valor):
+    return Medicion("atencion", instante, ubicacion, valor)
+
+
+def test_inicio_periodo():
+    miercoles = datetime(2024, 5, 15, 10, 30)
+    assert inicio_periodo(miercoles, "dia") == date(2024, 5, 15)
+    assert inicio_periodo(miercoles, "semana") == date(2024, 5, 13)
+    assert inicio_periodo(miercoles, "mes") == date(2024, 5, 1)
+
+
+def test_resumenes_por_nivel_geografico():
+    almacen = AlmacenMediciones()
+    almacen.agregar_muchas(
+        [
+            medicion(XALAPA_1234, datetime(2024, 5, 1, 9), 10),
+            medicion(XALAPA_1235, datetime(2024, 5, 1, 10), 20),
+            medicion(COATEPEC_1300, datetime(2024, 5, 2, 9), 30),
+        ]
+    )
+
+    desde, hasta = date(2024, 5, 1), date(2024, 6, 1)
+    seccion = almacen.resumen("atencion", "2024", "seccion", (30, 1234), desde, hasta)
+    municipio = almacen.resumen("atencion", "2024", "municipio", (30, 87), desde, hasta)
+    entidad = almacen.resumen("atencion", "2024", "entidad", (30,), desde, hasta)
+
+    assert seccion.mediciones == 1
+    assert (municipio.mediciones, municipio.promedio) == (2, 15)
+    assert (entidad.mediciones, entidad.minimo, entidad.maximo) == (3, 10, 30)
+    assert almacen.resumen("atencion", "2021", "entidad", (30,), desde, hasta) is None
+
+
+def test_serie_diaria_y_mensual():
+    almacen = AlmacenMediciones()
+    inicio = datetime(2024, 1, 1, 12)
+    almacen.agregar_muchas(medicion(XALAPA_1234, inicio + timedelta(days=d), 1) for d in range(90))
+
+    mensual = almacen.serie(
+        "atencion", "2024", "mes", "entidad", (30,), date(2024, 1, 1), date(2024, 4, 1)
+    )
+    assert [(periodo.month, r.mediciones) for periodo, r in mensual] == [(1, 31), (2, 29), (3, 30)]
+
+    diaria = almacen.serie(
+        "atencion", "2024", "dia", "municipio", (30, 87), date(2024, 2, 1), date(2024, 2, 8)
+    )
+    assert len(diaria) == 7
+
+
+def test_resumen_combina_meses_completos_y_dias_sueltos():
+    almacen = AlmacenMediciones()
+    inicio = datetime(2024, 1, 1, 12)
+    almacen.agregar_muchas(medicion(XALAPA_1234, inicio + timedelta(days=d), d) for d in range(120))
+
+    total = almacen.resumen(
+        "atencion", "2024", "entidad", (30,), date(2024, 1, 15), date(2024, 4, 10)
+    )
+    esperados = [
+        d
+        for d in range(120)
+        if date(2024, 1, 15) <= (inicio + timedelta(days=d)).date() < date(2024, 4, 10)
+    ]
+    assert total.mediciones == len(esperados)
+    assert total.suma == sum(esperados)
+
+
+def test_mediciones_crudas_en_bloques(monkeypatch):
+    monkeypatch.setattr(modulo_almacen, "FILAS_POR_BLOQUE", 10)
+    almacen = AlmacenMediciones()
+    inicio = datetime(2024, 1, 1)
+    almacen.agregar_muchas(
+        medicion(COATEPEC_1300, inicio + timedelta(hours=h), h) for h in range(48)
+    )
+
+    crudas = list(
+        almacen.mediciones("atencion", "2024", datetime(2024, 1, 2), datetime(2024, 1, 2, 3))
+    )
+    assert [m.valor for m in crudas] == [24, 25, 26]
+    assert crudas[0].ubicacion == COATEPEC_1300
+
+
+def test_instantes_con_zona_se_normalizan():
+    almacen = AlmacenMediciones(zona=ZoneInfo("America/Mexico_City"))
+    # Las 05:30 UTC del 1 de mayo son todavía el 30 de abril en Ciudad de México
+    original = medicion(XALAPA_1234, datetime(2024, 5, 1, 5, 30, tzinfo=UTC), 7)
+    almacen.agregar(original)
+
+    (leida,) = almacen.mediciones("atencion", "2024", datetime(2024, 4, 30), datetime(2024, 5, 2))
+    assert leida == original
+    assert leida.instante.tzinfo == ZoneInfo("America/Mexico_City")
+    assert leida.instante.hour == 23
+
+    dias = almacen.serie(
+        "atencion", "2024", "dia", "entidad", (30,), date(2024, 4, 1), date(2024, 6, 1)
+    )
+    assert [periodo for periodo, _ in dias] == [date(2024, 4, 30)]
+
+
+def test_zona_por_omision_es_utc():
+    almacen = AlmacenMediciones()
+    original = medicion(XALAPA_1234, datetime(2024, 5, 1, 23, 30, tzinfo=UTC), 7)
+    almacen.agregar(original)
+
+    (leida,) = almacen.mediciones("atencion", "2024", datetime(2024, 5, 1), datetime(2024, 5, 2))
+    assert leida == original
+    assert leida.instante.tzinfo is UTC
@@ -0,0 +1,87 @@
+from datetime import date
+
+import pytest
+
+from newbrain.mge.adapters.AlmacenMGEVersionado import AlmacenMGEVersionado
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+
+def sample_proceso(anio):
+    return ProcesoElectoral(
+        id=str(anio),
+        nombre_corto=f"PE{anio}",
+        nombre_oficial=f"Proceso Electoral {anio}",
+        fecha_inicio=date(anio, 1, 1),
+        fecha_fin=date(anio, 12, 31),
+    )
+
+
+def sample_municipios(proceso_id, total=3):
+    return [
+        Municipio(
+            id=i,
+            proceso_electoral_id=proceso_id,
+            entidad_id=30,
+            municipio_id=i,
+            nombre_municipio=f"Municipio {i}",
+            nombre_cabecera=f"Cabecera {i}",
+        )
+        for i in range(1, total + 1)
+    ]
+
+
+def test_proceso_sin_cambios_comparte_todos_los_registros():
+    almacen = AlmacenMGEVersionado()
+    almacen.registrar_proceso(sample_proceso(2018), sample_municipios("2018"))
+    resumen = almacen.registrar_proceso(
+        sample_proceso(2021), sample_municipios("2021"), base_id="2018"
+    )
+
+    assert resumen.compartidos == 3
+    assert almacen.registros_propios("2021") == 0
+    municipios = list(almacen.iterar(Municipio, "2021"))
+    assert municipios == sample_municipios("2021")
+    assert all(m.proceso_electoral_id == "2021" for m in municipios)
+
+
+def test_delta_con_alta_cambio_y_baja():
+    almacen = AlmacenMGEVersionado()
+    almacen.registrar_proceso(sample_proceso(2018), sample_municipios("2018"))
+
+    nuevos = sample_municipios("2021")
+    nuevos[0] = Municipio(1, "2021", 30, 1, "Municipio 1", "Nueva cabecera")
+    del nuevos[2]
+    nuevos.append(Municipio(4, "2021", 30, 4, "Municipio 4", "Cabecera 4"))
+    resumen = almacen.registrar_proceso(sample_proceso(2021), nuevos, base_id="2018")
+
+    assert (resumen.altas, resumen.cambios, resumen.bajas, resumen.compartidos) == (1, 1, 1, 1)
+    assert almacen.registros_propios("2021") == 2
+    assert sorted(m.id for m in almacen.iterar(Municipio, "2021")) == [1, 2, 4]
+    assert almacen.obtener(Municipio, "2021", 1).nombre_cabecera == "Nueva cabecera"
+    assert almacen.obtener(Municipio, "2021", 3) is None
+    # La versión anterior no se altera
+    assert almacen.obtener(Municipio, "2018", 1).nombre_cabecera == "Cabecera 1"
+    assert almacen.obtener(Municipio, "2018", 3) is not None
+
+
+def test_aplicar_delta_encadenado():
+    almacen = AlmacenMGEVersionado()
+    almacen.registrar_proceso(sample_proceso(2018), sample_municipios("2018"))
+    almacen.aplicar_delta(sample_proceso(2021), "2018", bajas={Municipio: [2]})
+    almacen.aplicar_delta(
+        sample_proceso(2024),
+        "2021",
+        cambios=[Municipio(2, "2024", 30, 2, "Municipio 2", "Restituido")],
+    )
+
+    assert sorted(m.id for m in almacen.iterar(Municipio, "2021")) == [1, 3]
+    assert sorted(m.id for m in almacen.iterar(Municipio, "2024")) == [1, 2, 3]
+    assert almacen.obtener(Municipio, "2024", 3).proceso_electoral_id == "2024"
+
+
+def test_no_admite_registrar_dos_veces_el_mismo_proceso():
+    almacen = AlmacenMGEVersionado()
+    almacen.registrar_proceso(sample_proceso(2018), [])
+    with pytest.raises(ValueError):
+        almacen.registrar_proceso(sample_proceso(2018), [])
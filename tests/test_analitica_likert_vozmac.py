@@ -0,0 +1,148 @@
+import random
+import statistics
+
+import pytest
+
+from newbrain.shared.contratos.UbicacionGeoelectoral import UbicacionGeoelectoral
+from newbrain.vozmac.application.AnaliticaLikert import AnaliticaLikert
+from newbrain.vozmac.domain.entities.Encuesta import Encuesta
+from newbrain.vozmac.domain.entities.Respuesta import Respuesta
+
+XALAPA = UbicacionGeoelectoral("2024", 30, 8, 87, 1234)
+COATEPEC = UbicacionGeoelectoral("2024", 30, 9, 38, 1300)
+
+
+def sample_encuesta():
+    return Encuesta(
+        id="satisfaccion",
+        nombre="Satisfacción en módulos",
+        reactivos=("trato", "tiempo", "claridad"),
+    )
+
+
+def sample_analitica():
+    analitica = AnaliticaLikert()
+    analitica.registrar_encuesta(sample_encuesta())
+    return analitica
+
+
+def alfa_directo(respuestas):
+    k = len(respuestas[0])
+    varianzas = sum(statistics.variance(r[i] for r in respuestas) for i in range(k))
+    total = statistics.variance(sum(r) for r in respuestas)
+    return k / (k - 1) * (1 - varianzas / total)
+
+
+def test_distribucion_medias_y_top_box():
+    analitica = sample_analitica()
+    analitica.agregar_muchas(
+        [
+            Respuesta("satisfaccion", XALAPA, (5, 4, 3)),
+            Respuesta("satisfaccion", XALAPA, (5, 2, 3)),
+            Respuesta("satisfaccion", COATEPEC, (1, 4, 5)),
+        ]
+    )
+
+    total = analitica.estadisticas("satisfaccion", "2024")
+    assert total.respuestas == 3
+    assert total.distribucion[0] == (1, 0, 0, 0, 2)
+    assert total.medias == (11 / 3, 10 / 3, 11 / 3)
+    assert total.top_box(0) == pytest.approx(2 / 3)
+    assert total.top_box(1, opciones=2) == pytest.approx(2 / 3)
+    assert analitica.total_respuestas("satisfaccion") == 3
+
+
+def test_alfa_de_cronbach_coincide_con_el_calculo_directo():
+    azar = random.Random(7)
+    respuestas = []
+    for _ in range(500):
+        base = azar.randint(1, 5)
+        respuestas.append(tuple(min(5, max(1, base + azar.randint(-1, 1))) for _ in range(3)))
+
+    analitica = sample_analitica()
+    analitica.agregar_muchas(Respuesta("satisfaccion", XALAPA, r) for r in respuestas)
+
+    alfa = analitica.estadisticas("satisfaccion", "2024").alfa_cronbach
+    assert alfa == pytest.approx(alfa_directo(respuestas))
+
+
+def test_recortes_por_unidad_del_mge():
+    analitica = sample_analitica()
+    analitica.agregar(Respuesta("satisfaccion", XALAPA, (5, 5, 5)))
+    analitica.agregar(Respuesta("satisfaccion", COATEPEC, (1, 1, 1)))
+
+    municipio = analitica.estadisticas("satisfaccion", "2024", "municipio", (30, 87))
+    entidad = analitica.estadisticas("satisfaccion", "2024", "entidad", (30,))
+    otro_proceso = analitica.estadisticas("satisfaccion", "2021")
+
+    assert municipio.respuestas == 1
+    assert municipio.medias == (5, 5, 5)
+    assert entidad.respuestas == 2
+    assert otro_proceso.respuestas == 0
+    assert otro_proceso.alfa_cronbach is None
+
+
+def test_respuesta_invalida():
+    analitica = sample_analitica()
+    with pytest.raises(ValueError):
+        analitica.agregar(Respuesta("satisfaccion", XALAPA, (5, 4)))
+    with pytest.raises(ValueError):
+        analitica.agregar(Respuesta("satisfaccion", XALAPA, (5, 4, 6)))
+
+
+def test_respuestas_crudas_conservan_su_recorte():
+    analitica = sample_analitica()
+    originales = [
+        Respuesta("satisfaccion", XALAPA, (5, 4, 3)),
+        Respuesta("satisfaccion", UbicacionGeoelectoral("2021", 30, 9, 38, 1300), (2, 2, 1)),
+        Respuesta("satisfaccion", COATEPEC, (1, 4, 5)),
+    ]
+    analitica.agregar_muchas(originales)
+
+    assert list(analitica.respuestas("satisfaccion")) == originales
+    assert list(analitica.respuestas("satisfaccion", "2021")) == [originales[1]]
+
+
+def test_recalcular_desde_las_respuestas_crudas():
+    azar = random.Random(11)
+    analitica = sample_analitica()
+    analitica.agregar_muchas(
+        Respuesta(
+            "satisfaccion",
+            azar.choice([XALAPA, COATEPEC]),
+            tuple(azar.randint(1, 5) for _ in range(3)),
+        )
+        for _ in range(200)
+    )
+    antes = [
+        analitica.estadisticas("satisfaccion", "2024"),
+        analitica.estadisticas("satisfaccion", "2024", "municipio", (30, 38)),
+        analitica.estadisticas("satisfaccion", "2024", "seccion", (30, 1234)),
+    ]
+
+    analitica.recalcular("satisfaccion")
+
+    assert [
+        analitica.estadisticas("satisfaccion", "2024"),
+        analitica.estadisticas("satisfaccion", "2024", "municipio", (30, 38)),
+        analitica.estadisticas("satisfaccion", "2024", "seccion", (30, 1234)),
+    ] == antes
+
+
+def test_registrar_de_nuevo_con_otra_forma_se_rechaza():
+    analitica = sample_analitica()
+    analitica.agregar(Respuesta("satisfaccion", XALAPA, (5, 4, 3)))
+
+    with pytest.raises(ValueError):
+        analitica.registrar_encuesta(Encuesta("satisfaccion", "Otra", ("trato", "tiempo")))
+    with pytest.raises(ValueError):
+        analitica.registrar_encuesta(
+            Encuesta("satisfaccion", "Otra", ("trato", "tiempo", "claridad"), escala=7)
+        )
+    # Con la misma forma (p. ej. un nombre corregido) se conserva lo acumulado
+    analitica.registrar_encuesta(
+        Encuesta("satisfaccion", "Satisfacción", ("trato", "tiempo", "claridad"))
+    )
+    analitica.agregar(Respuesta("satisfaccion", XALAPA, (1, 2, 3)))
+
+    assert [r.valores for r in analitica.respuestas("satisfaccion")] == [(5, 4, 3), (1, 2, 3)]
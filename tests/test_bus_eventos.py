@@ -0,0 +1,289 @@
+import asyncio
+import sqlite3
+from dataclasses import dataclass
+from datetime import date
+
+import pytest
+
+from newbrain.shared.eventos import BandejaSalida, BusEventos, EventoContrato, RetransmisorBandeja
+
+
+@dataclass(frozen=True, kw_only=True)
+class AlertaKPI(EventoContrato):
+    nombre = "prueba.kpi.alerta_emitida"
+
+    indicador: str
+    valor: float
+    periodo: date
+
+
+@dataclass(frozen=True, kw_only=True)
+class AccionCorrectiva(EventoContrato):
+    nombre = "prueba.pas.accion_correctiva"
+
+    folio: str
+
+
+def sample_alerta(valor=1.0):
+    return AlertaKPI(indicador="atencion", valor=valor, periodo=date(2024, 5, 1))
+
+
+def test_evento_se_serializa_por_nombre():
+    alerta = sample_alerta()
+    copia = EventoContrato.desde_dict(alerta.nombre, alerta.a_dict())
+
+    assert copia == alerta
+    with pytest.raises(LookupError):
+        EventoContrato.desde_dict("no.existe", {})
+
+
+def test_nombre_duplicado():
+    with pytest.raises(TypeError):
+
+        @dataclass(frozen=True, kw_only=True)
+        class Otra(EventoContrato):
+            nombre = "prueba.pas.accion_correctiva"
+
+
+def test_entrega_en_lotes_y_por_tipo():
+    async def escenario():
+        bus = BusEventos(tamano_lote=10, espera_lote=0.01)
+        lotes, acciones = [], []
+
+        async def manejar_alertas(eventos):
+            lotes.append(eventos)
+
+        async def manejar_acciones(eventos):
+            acciones.extend(eventos)
+
+        bus.suscribir(AlertaKPI, manejar_alertas)
+        bus.suscribir(AccionCorrectiva, manejar_acciones)
+        bus.iniciar()
+        for i in range(25):
+            await bus.publicar(sample_alerta(i))
+        await bus.publicar(AccionCorrectiva(folio="PAS-1"))
+        await bus.detener()
+        return lotes, acciones
+
+    lotes, acciones = asyncio.run(escenario())
+    assert [e.valor for lote in lotes for e in lote] == list(range(25))
+    assert max(len(lote) for lote in lotes) == 10
+    assert [a.folio for a in acciones] == ["PAS-1"]
+
+
+def test_cola_llena_frena_al_publicador():
+    async def escenario():
+        bus = BusEventos(capacidad=2)
+        suscripcion = bus.suscribir(AlertaKPI, lambda eventos: asyncio.sleep(0))
+        # Sin iniciar, nadie consume: la tercera publicación debe esperar
+        await bus.publicar(sample_alerta())
+        await bus.publicar(sample_alerta())
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(bus.publicar(sample_alerta()), 0.05)
+        return suscripcion
+
+    assert asyncio.run(escenario()).pendientes == 2
+
+
+def test_fallo_del_manejador_no_detiene_la_suscripcion():
+    async def escenario():
+        bus = BusEventos(tamano_lote=1)
+        recibidos = []
+
+        async def manejar(eventos):
+            if eventos[0].valor == 0:
+                raise RuntimeError("falla")
+            recibidos.extend(eventos)
+
+        suscripcion = bus.suscribir(AlertaKPI, manejar)
+        bus.iniciar()
+        await bus.publicar(sample_alerta(0))
+        await bus.publicar(sample_alerta(1))
+        await bus.detener()
+        return suscripcion, recibidos
+
+    suscripcion, recibidos = asyncio.run(escenario())
+    assert [e.valor for e in recibidos] == [1]
+    assert suscripcion.metricas.fallidos == 1
+
+
+def test_bandeja_salida_es_transaccional_y_sobrevive_reinicios(tmp_path):
+    ruta = tmp_path / "newbrain.db"
+    conexion = sqlite3.connect(ruta)
+    bandeja = BandejaSalida(conexion)
+    with conexion:
+        bandeja.registrar(sample_alerta(1))
+    with pytest.raises(RuntimeError):
+        with conexion:
+            bandeja.registrar(sample_alerta(2))
+            raise RuntimeError("la transacción del dominio falla")
+    conexion.close()
+
+    async def escenario():
+        # Otro proceso (o el mismo tras reiniciar) retransmite lo pendiente
+        bus = BusEventos(espera_lote=0.01)
+        recibidos = []
+
+        async def manejar(eventos):
+            recibidos.extend(eventos)
+
+        bus.suscribir(AlertaKPI, manejar)
+        bus.iniciar()
+        retransmisor = RetransmisorBandeja(ruta, bus)
+        publicados = await retransmisor.retransmitir()
+        await bus.detener()
+        return retransmisor, publicados, recibidos
+
+    retransmisor, publicados, recibidos = asyncio.run(escenario())
+    assert publicados == 1
+    assert [e.valor for e in recibidos] == [1]
+    assert retransmisor.pendientes() == []
+    assert retransmisor.purgar_entregados() == 1
+
+
+def test_evento_queda_pendiente_si_el_manejador_falla(tmp_path):
+    ruta = tmp_path / "newbrain.db"
+    conexion = sqlite3.connect(ruta)
+    with conexion:
+        BandejaSalida(conexion).registrar(sample_alerta(1))
+
+    async def escenario():
+        bus = BusEventos(espera_lote=0.01)
+        recibidos, fallar = [], [True]
+
+        async def manejar(eventos):
+            if fallar[0]:
+                raise RuntimeError("falla")
+            recibidos.extend(eventos)
+
+        bus.suscribir(AlertaKPI, manejar)
+        bus.iniciar()
+        retransmisor = RetransmisorBandeja(ruta, bus)
+        primera = await retransmisor.retransmitir()
+        pendientes = len(retransmisor.pendientes())
+        fallar[0] = False
+        segunda = await retransmisor.retransmitir()
+        await bus.detener()
+        return primera, pendientes, segunda, retransmisor, recibidos
+
+    primera, pendientes, segunda, retransmisor, recibidos = asyncio.run(escenario())
+    assert (primera, pendientes, segunda) == (0, 1, 1)
+    assert [e.valor for e in recibidos] == [1]
+    assert retransmisor.pendientes() == []
+
+
+def test_evento_sin_acuse_queda_pendiente(tmp_path):
+    ruta = tmp_path / "newbrain.db"
+    conexion = sqlite3.connect(ruta)
+    with conexion:
+        BandejaSalida(conexion).registrar(sample_alerta(1))
+
+    async def escenario():
+        # El bus no se inició: nadie consume y el acuse no llega
+        bus = BusEventos()
+        bus.suscribir(AlertaKPI, lambda eventos: asyncio.sleep(0))
+        retransmisor = RetransmisorBandeja(ruta, bus, espera_acuse=0.05)
+        publicados = await retransmisor.retransmitir()
+        en_vuelo = retransmisor.en_vuelo
+        # Detener un bus no iniciado no espera a drenar: acusa lo encolado como no entregado
+        await asyncio.wait_for(bus.detener(), 1)
+        return retransmisor, publicados, en_vuelo
+
+    retransmisor, publicados, en_vuelo = asyncio.run(escenario())
+    assert (publicados, en_vuelo) == (0, 1)
+    assert len(retransmisor.pendientes()) == 1
+
+
+def test_manejador_lento_no_recibe_duplicados(tmp_path):
+    ruta = tmp_path / "newbrain.db"
+    conexion = sqlite3.connect(ruta)
+    bandeja = BandejaSalida(conexion)
+    with conexion:
+        for valor in range(3):
+            bandeja.registrar(sample_alerta(valor))
+
+    async def escenario():
+        bus = BusEventos(espera_lote=0.01)
+        recibidos = []
+
+        async def manejar(eventos):
+            await asyncio.sleep(0.3)
+            recibidos.extend(eventos)
+
+        bus.suscribir(AlertaKPI, manejar)
+        bus.iniciar()
+        retransmisor = RetransmisorBandeja(ruta, bus, intervalo=0.05, espera_acuse=0.1)
+        tarea = asyncio.create_task(retransmisor.ejecutar())
+        await asyncio.sleep(1)
+        tarea.cancel()
+        await asyncio.gather(tarea, return_exceptions=True)
+        await bus.detener()
+        return retransmisor, recibidos
+
+    retransmisor, recibidos = asyncio.run(escenario())
+    assert sorted(e.valor for e in recibidos) == [0, 1, 2]
+    assert retransmisor.en_vuelo == 0
+    assert retransmisor.pendientes() == []
+
+
+def test_detener_bus_no_iniciado_acusa_no_entregado():
+    async def escenario():
+        bus = BusEventos()
+        bus.suscribir(AlertaKPI, lambda eventos: asyncio.sleep(0))
+        (acuse,) = await bus.publicar_con_acuse(sample_alerta())
+        await asyncio.wait_for(bus.detener(), 1)
+        return acuse
+
+    assert asyncio.run(escenario()).result() is False
+
+
+def test_crear_bandeja_no_confirma_la_transaccion_del_llamador(tmp_path):
+    conexion = sqlite3.connect(tmp_path / "newbrain.db")
+    conexion.execute("CREATE TABLE folios (folio TEXT)")
+    conexion.execute("INSERT INTO folios VALUES ('PAS-1')")
+    BandejaSalida(conexion)
+    conexion.rollback()
+
+    assert conexion.execute("SELECT COUNT(*) FROM folios").fetchone() == (0,)
+
+
+def test_retransmisor_no_ve_ni_confirma_la_transaccion_abierta(tmp_path):
+    ruta = tmp_path / "newbrain.db"
+    conexion = sqlite3.connect(ruta)
+    conexion.execute("CREATE TABLE folios (folio TEXT)")
+    bandeja = BandejaSalida(conexion)
+    with conexion:
+        bandeja.registrar(sample_alerta(1))
+
+    async def escenario():
+        bus = BusEventos(espera_lote=0.01)
+        recibidos = []
+        recibido = asyncio.Event()
+
+        async def manejar(eventos):
+            recibidos.extend(eventos)
+            recibido.set()
+
+        bus.suscribir(AlertaKPI, manejar)
+        bus.iniciar()
+        retransmisor = RetransmisorBandeja(ruta, bus)
+
+        # El dominio abre una transacción y la retransmisión corre mientras sigue abierta
+        conexion.execute("INSERT INTO folios VALUES ('PAS-1')")
+        bandeja.registrar(sample_alerta(2))
+        tarea = asyncio.create_task(retransmisor.retransmitir())
+        await recibido.wait()
+        conexion.rollback()
+
+        publicados = await tarea
+        await asyncio.sleep(0.05)
+        publicados += await retransmisor.retransmitir()
+        await bus.detener()
+        return retransmisor, publicados, recibidos
+
+    retransmisor, publicados, recibidos = asyncio.run(escenario())
+    assert publicados == 1
+    assert [e.valor for e in recibidos] == [1]
+    assert retransmisor.pendientes() == []
+    assert conexion.execute("SELECT COUNT(*) FROM folios").fetchone() == (0,)
+    assert conexion.execute("SELECT COUNT(*) FROM bandeja_salida").fetchone() == (1,)
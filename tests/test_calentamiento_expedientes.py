@@ -0,0 +1,78 @@
+import multiprocessing
+from datetime import date
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.CacheExpedientes import CacheExpedientes
+from newbrain.mge.application.CalentamientoExpedientes import calentar_expedientes
+from newbrain.mge.application.ConstructorExpedientes import SolicitudExpediente
+from newbrain.mge.application.MapaIdentidadMGE import RepositorioMGECanonico
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+
+def sample_repositorio():
+    repo = RepositorioMGEMemoria()
+    repo.agregar_proceso(
+        ProcesoElectoral(
+            "2024", "PE2024", "Proceso Electoral 2024", date(2024, 1, 1), date(2024, 12, 31)
+        )
+    )
+    for entidad in (29, 30):
+        repo.agregar(
+            [
+                EntidadFederativa(entidad, f"ENTIDAD {entidad}", f"Entidad {entidad}", "XX", "XXX"),
+                DistritoElectoralFederal(entidad * 10 + 1, "2024", entidad, 1, "Cabecera"),
+                DistritoElectoralLocal(entidad * 10 + 2, "2024", entidad, 1, "Cabecera"),
+                Municipio(entidad * 10 + 3, "2024", entidad, 1, "Municipio 1", "Cabecera"),
+                Municipio(entidad * 10 + 4, "2024", entidad, 2, "Municipio 2", "Cabecera"),
+                SeccionElectoral(
+                    entidad * 10 + 5, "2024", entidad, entidad * 10 + 1, entidad * 10 + 2, 1, 100
+                ),
+            ]
+        )
+    return repo
+
+
+def test_calentar_llena_la_cache_por_nivel():
+    cache = CacheExpedientes()
+    avances = []
+    reporte = calentar_expedientes(
+        sample_repositorio(),
+        "2024",
+        cache,
+        procesos=2,
+        al_avanzar=lambda nivel, hechos, total: avances.append((nivel, hechos, total)),
+    )
+
+    por_nivel = {avance.nivel: avance.expedientes for avance in reporte.niveles}
+    assert por_nivel == {
+        "entidad": 2,
+        "distrito_electoral_federal": 2,
+        "distrito_electoral_local": 2,
+        "municipio": 4,
+    }
+    assert reporte.expedientes == len(cache) == 10
+    assert ("municipio", 4, 4) in avances
+
+    expediente = cache.obtener(SolicitudExpediente("2024", 30, "distrito_electoral_federal", 301))
+    assert [s.seccion for s in expediente.secciones] == [100]
+
+
+def test_calentar_con_spawn_y_repositorio_canonico():
+    cache = CacheExpedientes()
+    repositorio = RepositorioMGECanonico(sample_repositorio())
+
+    reporte = calentar_expedientes(
+        repositorio,
+        "2024",
+        cache,
+        niveles=("entidad",),
+        procesos=1,
+        contexto=multiprocessing.get_context("spawn"),
+    )
+
+    assert reporte.expedientes == len(cache) == 2
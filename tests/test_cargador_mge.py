@@ -0,0 +1,112 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.CargadorMGE import CargadoresMGE, cargar_expediente_seccion
+from newbrain.mge.application.ConstructorExpedientes import (
+    ConstructorExpedientes,
+    ExpedienteNoEncontrado,
+    SolicitudExpediente,
+)
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.LimiteLocalidad import LimiteLocalidad
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+
+class RepositorioContador(RepositorioMGEMemoria):
+    def __init__(self):
+        super().__init__()
+        self.busquedas = []
+
+    def buscar(self, tipo, proceso_id, campos, claves):
+        self.busquedas.append(tipo)
+        return super().buscar(tipo, proceso_id, campos, claves)
+
+
+def sample_repositorio():
+    repo = RepositorioContador()
+    repo.agregar(
+        [
+            ProcesoElectoral(
+                "2024", "PE2024", "Proceso Electoral 2024", date(2024, 1, 1), date(2024, 12, 31)
+            ),
+            EntidadFederativa(30, "VERACRUZ DE IGNACIO DE LA LLAVE", "Veracruz", "VR", "VER"),
+            DistritoElectoralFederal(1, "2024", 30, 1, "Xalapa"),
+            DistritoElectoralFederal(2, "2024", 30, 2, "Coatepec"),
+            DistritoElectoralLocal(10, "2024", 30, 10, "Xalapa"),
+            Municipio(1, "2024", 30, 87, "Xalapa", "Xalapa-Enríquez"),
+            Municipio(2, "2024", 30, 38, "Coatepec", "Coatepec"),
+            SeccionElectoral(1, "2024", 30, 1, 10, 87, 1234),
+            SeccionElectoral(2, "2024", 30, 1, 10, 87, 1235),
+            SeccionElectoral(3, "2024", 30, 2, 10, 38, 1300),
+            # Fuera de orden a propósito: ambos caminos deben ordenar igual
+            LimiteLocalidad(2, "2024", 30, 87, 2, "Las Trancas"),
+            LimiteLocalidad(1, "2024", 30, 87, 1, "Xalapa-Enríquez"),
+            LimiteLocalidad(3, "2024", 30, 38, 1, "Coatepec"),
+            Manzana(1, "2024", 30, 87, 1, 1234, 1),
+            Manzana(2, "2024", 30, 87, 2, 1234, 2),
+            Manzana(3, "2024", 30, 87, 1, 1235, 1),
+            Manzana(4, "2024", 30, 38, 1, 1300, 1),
+        ]
+    )
+    return repo
+
+
+def test_expediente_seccion_coincide_con_el_constructor():
+    repo = sample_repositorio()
+    cargado = asyncio.run(cargar_expediente_seccion(CargadoresMGE(repo, "2024"), 30, 1))
+    construido = ConstructorExpedientes(repo).construir(
+        SolicitudExpediente("2024", 30, "seccion", 1)
+    )
+
+    assert cargado == construido
+    assert [loc.nombre_localidad for loc in cargado.localidades] == [
+        "Xalapa-Enríquez",
+        "Las Trancas",
+    ]
+
+
+def test_muchos_expedientes_una_consulta_por_tipo():
+    repo = sample_repositorio()
+    cargadores = CargadoresMGE(repo, "2024")
+
+    async def escenario():
+        return await asyncio.gather(
+            *(cargar_expediente_seccion(cargadores, 30, seccion) for seccion in (1, 2, 3))
+        )
+
+    expedientes = asyncio.run(escenario())
+
+    assert [e.secciones[0].seccion for e in expedientes] == [1234, 1235, 1300]
+    assert [e.municipios[0].nombre_municipio for e in expedientes] == [
+        "Xalapa",
+        "Xalapa",
+        "Coatepec",
+    ]
+    # Entidad, sección, DF, DL, municipio, manzanas y localidades: una consulta cada uno
+    assert len(repo.busquedas) == len(set(repo.busquedas)) == 7
+    assert cargadores.consultas == 7
+
+
+def test_memoriza_por_solicitud():
+    repo = sample_repositorio()
+    cargadores = CargadoresMGE(repo, "2024")
+
+    async def escenario():
+        await cargar_expediente_seccion(cargadores, 30, 1)
+        await cargar_expediente_seccion(cargadores, 30, 1)
+
+    asyncio.run(escenario())
+    assert len(repo.busquedas) == 7
+
+
+def test_seccion_inexistente():
+    with pytest.raises(ExpedienteNoEncontrado):
+        asyncio.run(cargar_expediente_seccion(CargadoresMGE(sample_repositorio(), "2024"), 30, 99))
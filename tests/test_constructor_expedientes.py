@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.ConstructorExpedientes import (
+    ConstructorExpedientes,
+    ExpedienteNoEncontrado,
+    SolicitudExpediente,
+)
+from newbrain.mge.domain.entities.DistritoElectoralFederal import DistritoElectoralFederal
+from newbrain.mge.domain.entities.DistritoElectoralLocal import DistritoElectoralLocal
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.Manzana import Manzana
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+from newbrain.mge.domain.entities.SeccionElectoral import SeccionElectoral
+
+
+def sample_repositorio():
+    repo = RepositorioMGEMemoria()
+    repo.agregar_proceso(
+        ProcesoElectoral(
+            id="2024",
+            nombre_corto="PE2024",
+            nombre_oficial="Proceso Electoral 2024",
+            fecha_inicio=date(2024, 1, 1),
+            fecha_fin=date(2024, 12, 31),
+        )
+    )
+    repo.agregar(
+        [
+            EntidadFederativa(30, "VERACRUZ DE IGNACIO DE LA LLAVE", "Veracruz", "VR", "VER"),
+            DistritoElectoralFederal(1, "2024", 30, 1, "Xalapa"),
+            DistritoElectoralFederal(2, "2024", 30, 2, "Coatepec"),
+            DistritoElectoralLocal(10, "2024", 30, 10, "Xalapa"),
+            Municipio(1, "2024", 30, 87, "Xalapa", "Xalapa-Enríquez"),
+            Municipio(2, "2024", 30, 38, "Coatepec", "Coatepec"),
+            SeccionElectoral(1, "2024", 30, 1, 10, 87, 1234),
+            SeccionElectoral(2, "2024", 30, 1, 10, 87, 1235),
+            SeccionElectoral(3, "2024", 30, 2, 10, 38, 1300),
+            Manzana(1, "2024", 30, 87, 1, 1234, 1),
+            Manzana(2, "2024", 30, 87, 1, 1234, 2),
+            Manzana(3, "2024", 30, 87, 1, 1235, 1),
+        ]
+    )
+    return repo
+
+
+def test_construir_expediente_entidad():
+    exp = ConstructorExpedientes(sample_repositorio()).construir(
+        SolicitudExpediente("2024", 30, "entidad")
+    )
+
+    assert len(exp.distritos_federales) == 2
+    assert len(exp.municipios) == 2
+    assert len(exp.secciones) == 3
+
+
+def test_construir_expediente_distrito_federal():
+    exp = ConstructorExpedientes(sample_repositorio()).construir(
+        SolicitudExpediente("2024", 30, "distrito_electoral_federal", 1)
+    )
+
+    assert [s.seccion for s in exp.secciones] == [1234, 1235]
+
+
+def test_construir_expediente_municipio():
+    exp = ConstructorExpedientes(sample_repositorio()).construir(
+        SolicitudExpediente("2024", 30, "municipio", 2)
+    )
+
+    assert [s.seccion for s in exp.secciones] == [1300]
+
+
+def test_construir_expediente_seccion():
+    exp = ConstructorExpedientes(sample_repositorio()).construir(
+        SolicitudExpediente("2024", 30, "seccion", 1)
+    )
+
+    assert exp.municipios[0].nombre_municipio == "Xalapa"
+    assert exp.distritos_federales[0].distrito == 1
+    assert exp.distritos_locales[0].distrito_local == 10
+    assert [m.manzana for m in exp.manzanas] == [1, 2]
+
+
+def test_unidad_inexistente():
+    with pytest.raises(ExpedienteNoEncontrado):
+        ConstructorExpedientes(sample_repositorio()).construir(
+            SolicitudExpediente("2024", 30, "municipio", 99)
+        )
+
+
+def test_solicitudes_por_nivel():
+    constructor = ConstructorExpedientes(sample_repositorio())
+
+    assert len(list(constructor.solicitudes("2024", "entidad"))) == 1
+    assert [s.unidad_id for s in constructor.solicitudes("2024", "municipio")] == [1, 2]
@@ -0,0 +1,142 @@
+import gzip
+import io
+import json
+from datetime import date
+
+import pytest
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application import ExportadorMGE as modulo_exportador
+from newbrain.mge.application.ExportadorMGE import ExportadorMGE
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+
+def sample_repositorio(municipios=3):
+    repo = RepositorioMGEMemoria()
+    repo.agregar_proceso(
+        ProcesoElectoral(
+            id="2024",
+            nombre_corto="PE2024",
+            nombre_oficial="Proceso Electoral 2024",
+            fecha_inicio=date(2024, 1, 1),
+            fecha_fin=date(2024, 12, 31),
+        )
+    )
+    repo.agregar(
+        [
+            EntidadFederativa(
+                entidad=30,
+                nombre_entidad="VERACRUZ DE IGNACIO DE LA LLAVE",
+                nombre_corto="Veracruz",
+                nombre_clave="VR",
+                nombre_abrev="VER",
+            )
+        ]
+    )
+    repo.agregar(
+        Municipio(
+            id=i,
+            proceso_electoral_id="2024",
+            entidad_id=30,
+            municipio_id=i,
+            nombre_municipio=f"Municipio {i}",
+            nombre_cabecera=f"Cabecera {i}",
+        )
+        for i in range(1, municipios + 1)
+    )
+    return repo
+
+
+def test_exportar_nivel_csv():
+    salida = io.BytesIO()
+    resultado = ExportadorMGE(sample_repositorio()).exportar_nivel("2024", "municipio", salida)
+
+    lineas = salida.getvalue().decode("utf-8").splitlines()
+    assert lineas[0] == (
+        "id,proceso_electoral_id,entidad_id,municipio_id,nombre_municipio,nombre_cabecera"
+    )
+    assert lineas[1] == "1,2024,30,1,Municipio 1,Cabecera 1"
+    assert len(lineas) == 4
+    assert resultado.filas == 3
+    assert resultado.filas_por_segundo > 0
+
+
+def test_exportar_nivel_ndjson_gzip():
+    salida = io.BytesIO()
+    ExportadorMGE(sample_repositorio()).exportar_nivel(
+        "2024", "municipio", salida, formato="ndjson", comprimir=True
+    )
+
+    filas = [json.loads(linea) for linea in gzip.decompress(salida.getvalue()).splitlines()]
+    assert len(filas) == 3
+    assert filas[2]["nombre_municipio"] == "Municipio 3"
+
+
+def test_generar_entrega_bloques_acotados(monkeypatch):
+    monkeypatch.setattr(modulo_exportador, "TAMANO_BLOQUE", 256)
+    bloques = list(ExportadorMGE(sample_repositorio(municipios=200)).generar("2024", "municipio"))
+
+    assert len(bloques) > 1
+    assert all(len(bloque) < 1024 for bloque in bloques)
+    assert b"".join(bloques).count(b"\n") == 201
+
+
+def test_exportar_proceso_un_archivo_por_nivel(tmp_path):
+    resultados = ExportadorMGE(sample_repositorio()).exportar_proceso(
+        "2024", tmp_path, formato="csv", comprimir=True
+    )
+
+    por_nivel = {r.nivel: r.filas for r in resultados}
+    assert por_nivel["entidad"] == 1
+    assert por_nivel["municipio"] == 3
+    assert por_nivel["seccion"] == 0
+    assert (tmp_path / "municipio.csv.gz").exists()
+
+
+def test_generar_no_admite_formato_columnar():
+    with pytest.raises(ValueError):
+        ExportadorMGE(sample_repositorio()).generar("2024", "municipio", "parquet")
+
+
+def sample_cliente():
+    pytest.importorskip("httpx")
+    fastapi = pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+
+    from newbrain.mge.adapters.api_exportacion import crear_router_exportacion
+
+    app = fastapi.FastAPI()
+    app.include_router(crear_router_exportacion(sample_repositorio()))
+    return TestClient(app)
+
+
+def test_api_exporta_nivel_en_streaming():
+    with sample_cliente().stream("GET", "/mge/procesos/2024/exportacion/municipio") as respuesta:
+        cuerpo = b"".join(respuesta.iter_bytes())
+
+    assert respuesta.status_code == 200
+    assert respuesta.headers["content-type"].startswith("text/csv")
+    assert 'filename="2024_municipio.csv"' in respuesta.headers["content-disposition"]
+    assert cuerpo.decode("utf-8").splitlines()[3] == "3,2024,30,3,Municipio 3,Cabecera 3"
+
+
+def test_api_gzip_entrega_el_archivo_comprimido():
+    respuesta = sample_cliente().get(
+        "/mge/procesos/2024/exportacion/municipio", params={"formato": "ndjson", "gzip": True}
+    )
+
+    assert respuesta.status_code == 200
+    assert respuesta.headers["content-type"] == "application/gzip"
+    assert "content-encoding" not in respuesta.headers
+    assert 'filename="2024_municipio.ndjson.gz"' in respuesta.headers["content-disposition"]
+    assert len(gzip.decompress(respuesta.content).splitlines()) == 3
+
+
+def test_api_rechaza_nivel_y_formato_desconocidos():
+    cliente = sample_cliente()
+    url = "/mge/procesos/2024/exportacion"
+
+    assert cliente.get(f"{url}/colonia").status_code == 404
+    assert cliente.get(f"{url}/municipio", params={"formato": "xml"}).status_code == 400
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+
+from newbrain.ideas.application.IndiceCasiDuplicados import IndiceCasiDuplicados, normalizar, tejas
+from newbrain.ideas.domain.entities.Sugerencia import Sugerencia
+
+BASE = (
+    "Instalar un sistema de turnos en los módulos de atención ciudadana para reducir "
+    "el tiempo de espera de las personas que acuden a tramitar su credencial"
+)
+PARECIDA = (
+    "Instalar un sistema de turnos en los modulos de atencion ciudadana para reducir "
+    "el tiempo de espera de quienes acuden a tramitar su credencial para votar"
+)
+DISTINTA = (
+    "Digitalizar los expedientes de cartografía electoral y publicar un visor en la "
+    "intranet para consulta de las juntas distritales"
+)
+
+
+def test_normalizar_y_tejas():
+    assert normalizar("Atención CIUDADANA, módulo 3") == ["atencion", "ciudadana", "modulo", "3"]
+    assert len(tejas("uno dos tres cuatro")) == 2
+    assert len(tejas("hola")) == 1
+    assert tejas("") == set()
+
+
+def test_similares_encuentra_la_version_parecida():
+    indice = IndiceCasiDuplicados()
+    indice.agregar("IDEA-1", BASE)
+    indice.agregar("IDEA-2", DISTINTA)
+
+    resultado = indice.similares(PARECIDA)
+    assert [id_ for id_, _ in resultado] == ["IDEA-1"]
+    assert resultado[0][1] > 0.5
+    assert indice.similares(BASE)[0] == ("IDEA-1", 1.0)
+
+
+def test_agrupar_historico():
+    sugerencias = [
+        Sugerencia("IDEA-1", "Turnos en módulos", BASE, datetime(2024, 3, 1)),
+        Sugerencia("IDEA-2", "Turnos en módulos", PARECIDA, datetime(2024, 3, 2)),
+        Sugerencia("IDEA-3", "Visor de cartografía", DISTINTA, datetime(2024, 3, 3)),
+    ]
+    indice = IndiceCasiDuplicados()
+    indice.agregar_muchas((s.id, s.texto) for s in sugerencias)
+
+    assert indice.agrupar() == [["IDEA-1", "IDEA-2"]]
+    assert len(indice) == 3
+
+
+def test_bandas_deben_dividir_permutaciones():
+    with pytest.raises(ValueError):
+        IndiceCasiDuplicados(permutaciones=100, bandas=32)
+
+
+def test_reindexar_un_id_reemplaza_sus_cubetas():
+    indice = IndiceCasiDuplicados()
+    indice.agregar("IDEA-1", BASE)
+    for _ in range(3):
+        indice.agregar("IDEA-1", DISTINTA)
+
+    assert len(indice) == 1
+    assert indice.similares(BASE) == []
+    assert indice.similares(DISTINTA) == [("IDEA-1", 1.0)]
+    assert all(ids == ["IDEA-1"] for cubetas in indice._cubetas for ids in cubetas.values())
+
+
+def test_eliminar_saca_al_id_de_sus_cubetas():
+    indice = IndiceCasiDuplicados()
+    indice.agregar("IDEA-1", BASE)
+    indice.eliminar("IDEA-1")
+    indice.eliminar("NO-EXISTE")
+
+    assert len(indice) == 0
+    assert indice.similares(BASE) == []
+    assert all(not cubetas for cubetas in indice._cubetas)
+
+
+def test_textos_sin_palabras_no_se_agrupan():
+    indice = IndiceCasiDuplicados()
+    indice.agregar_muchas([("IDEA-1", ""), ("IDEA-2", "¡¡...!!"), ("IDEA-3", BASE)])
+
+    assert len(indice) == 1
+    assert indice.agrupar() == []
+    assert indice.similares("?!") == []
@@ -0,0 +1,119 @@
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.IngestaMGE import ArchivoFuente, IngestaMGE, ManifiestoIngesta
+from newbrain.mge.domain.entities.Municipio import Municipio
+
+ENCABEZADO = "id,proceso_electoral_id,entidad_id,municipio_id,nombre_municipio,nombre_cabecera\n"
+
+
+def escribir_municipios(ruta, filas):
+    ruta.write_text(ENCABEZADO + "".join(f"{fila}\n" for fila in filas), encoding="utf-8")
+
+
+class AlmacenEspia(RepositorioMGEMemoria):
+    def __init__(self):
+        super().__init__()
+        self.guardados = []
+        self.eliminados = []
+
+    def guardar(self, registros):
+        registros = list(registros)
+        self.guardados.extend(registros)
+        super().guardar(registros)
+
+    def eliminar(self, tipo, proceso_id, ids):
+        ids = list(ids)
+        self.eliminados.extend(ids)
+        super().eliminar(tipo, proceso_id, ids)
+
+
+def sample_ingesta(tmp_path):
+    fuente = tmp_path / "municipios_30.csv"
+    escribir_municipios(
+        fuente,
+        [
+            "1,2024,30,87,Xalapa,Xalapa-Enríquez",
+            "2,2024,30,38,Coatepec,Coatepec",
+            "3,2024,30,65,Emiliano Zapata,Dos Ríos",
+        ],
+    )
+    almacen = AlmacenEspia()
+    ingesta = IngestaMGE(almacen, ManifiestoIngesta(tmp_path / "manifiesto"))
+    archivo = ArchivoFuente(fuente, "municipio", "2024", 30)
+    return fuente, almacen, ingesta, archivo
+
+
+def test_primera_ingesta_carga_todo(tmp_path):
+    _, almacen, ingesta, archivo = sample_ingesta(tmp_path)
+    (resultado,) = ingesta.ingerir([archivo])
+
+    assert resultado.altas == 3
+    assert [m.nombre_municipio for m in almacen.iterar(Municipio, "2024")] == [
+        "Xalapa",
+        "Coatepec",
+        "Emiliano Zapata",
+    ]
+    assert (tmp_path / "manifiesto" / "2024" / "30" / "municipio.json").exists()
+    assert (tmp_path / "manifiesto" / "2024" / "30" / "municipio.sha256").exists()
+
+
+def test_archivo_identico_se_omite(tmp_path):
+    _, almacen, ingesta, archivo = sample_ingesta(tmp_path)
+    ingesta.ingerir([archivo])
+    almacen.guardados.clear()
+
+    # Un manifiesto recién leído de disco basta para omitir
+    ingesta = IngestaMGE(almacen, ManifiestoIngesta(tmp_path / "manifiesto"))
+    (resultado,) = ingesta.ingerir([archivo])
+
+    assert resultado.omitido
+    assert almacen.guardados == []
+
+
+def test_archivo_omitido_no_reescribe_el_manifiesto(tmp_path):
+    _, _, ingesta, archivo = sample_ingesta(tmp_path)
+    ingesta.ingerir([archivo])
+    huellas = tmp_path / "manifiesto" / "2024" / "30" / "municipio.json"
+    huellas.unlink()
+
+    (resultado,) = ingesta.ingerir([archivo])
+
+    assert resultado.omitido
+    assert not huellas.exists()
+
+
+def test_manifiesto_en_memoria_vive_con_el_almacen(tmp_path):
+    _, _, _, archivo = sample_ingesta(tmp_path)
+    almacen = RepositorioMGEMemoria()
+    ingesta = IngestaMGE(almacen, ManifiestoIngesta())
+    ingesta.ingerir([archivo])
+    assert ingesta.ingerir([archivo])[0].omitido
+
+    # Un almacén nuevo con su propio manifiesto vuelve a cargar todo
+    nuevo = RepositorioMGEMemoria()
+    (resultado,) = IngestaMGE(nuevo, ManifiestoIngesta()).ingerir([archivo])
+
+    assert resultado.altas == 3
+    assert len(list(nuevo.iterar(Municipio, "2024"))) == 3
+    assert not (tmp_path / "manifiesto").exists()
+
+
+def test_archivo_modificado_aplica_solo_las_diferencias(tmp_path):
+    fuente, almacen, ingesta, archivo = sample_ingesta(tmp_path)
+    ingesta.ingerir([archivo])
+    almacen.guardados.clear()
+
+    escribir_municipios(
+        fuente,
+        [
+            "1,2024,30,87,Xalapa,Xalapa-Enríquez",
+            "2,2024,30,38,Coatepec,Coatepec de Bravo",
+            "4,2024,30,99,Nuevo,Nuevo",
+        ],
+    )
+    (resultado,) = ingesta.ingerir([archivo])
+
+    assert (resultado.altas, resultado.cambios, resultado.bajas) == (1, 1, 1)
+    assert sorted(m.id for m in almacen.guardados) == [2, 4]
+    assert almacen.eliminados == [3]
+    assert sorted(m.id for m in almacen.iterar(Municipio, "2024")) == [1, 2, 4]
+    assert next(almacen.iterar(Municipio, "2024")).municipio_id == 87
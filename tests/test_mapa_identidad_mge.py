@@ -0,0 +1,88 @@
+import gc
+import pickle
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.MapaIdentidadMGE import MapaIdentidadMGE, RepositorioMGECanonico
+from newbrain.mge.domain.entities.Municipio import Municipio
+
+
+def sample_municipio(proceso_id="2024", cabecera="Xalapa"):
+    # Textos armados en tiempo de ejecución para que no sean constantes internadas
+    return Municipio(
+        id=1,
+        proceso_electoral_id=proceso_id,
+        entidad_id=30,
+        municipio_id=87,
+        nombre_municipio="".join(["Xala", "pa"]),
+        nombre_cabecera="".join(cabecera),
+    )
+
+
+def test_misma_entidad_devuelve_la_misma_instancia():
+    mapa = MapaIdentidadMGE()
+    primera = mapa.canonico(sample_municipio())
+    segunda = mapa.canonico(sample_municipio())
+
+    assert primera is segunda
+    assert mapa.aciertos == 1
+    assert len(mapa) == 1
+
+
+def test_distinto_proceso_es_distinta_instancia():
+    mapa = MapaIdentidadMGE()
+    a = mapa.canonico(sample_municipio("2021"))
+    b = mapa.canonico(sample_municipio("2024"))
+
+    assert a is not b
+    assert len(mapa) == 2
+
+
+def test_datos_nuevos_reemplazan_la_instancia_canonica():
+    mapa = MapaIdentidadMGE()
+    anterior = mapa.canonico(sample_municipio())
+    nueva = mapa.canonico(sample_municipio(cabecera="Xalapa-Enríquez"))
+
+    assert nueva is not anterior
+    assert mapa.obtener(Municipio, "2024", 1) is nueva
+
+
+def test_textos_internados():
+    mapa = MapaIdentidadMGE()
+    a = mapa.canonico(sample_municipio("2021"))
+    b = mapa.canonico(sample_municipio("2024"))
+
+    assert a.nombre_municipio is b.nombre_municipio
+
+
+def test_referencias_debiles():
+    mapa = MapaIdentidadMGE()
+    instancia = mapa.canonico(sample_municipio())
+    assert len(mapa) == 1
+
+    del instancia
+    gc.collect()
+    assert len(mapa) == 0
+
+
+def test_repositorio_canonico_comparte_instancias_entre_cargas():
+    mapa = MapaIdentidadMGE()
+    fuentes = [RepositorioMGEMemoria(), RepositorioMGEMemoria()]
+    for fuente in fuentes:
+        fuente.agregar([sample_municipio()])
+    primero, segundo = (RepositorioMGECanonico(fuente, mapa) for fuente in fuentes)
+
+    instancia = next(primero.iterar(Municipio, "2024"))
+    assert next(segundo.iterar(Municipio, "2024", entidad_id=30)) is instancia
+    assert mapa.aciertos == 1
+
+
+def test_repositorio_canonico_se_serializa_sin_su_mapa():
+    fuente = RepositorioMGEMemoria()
+    fuente.agregar([sample_municipio()])
+    repositorio = RepositorioMGECanonico(fuente)
+    instancia = next(repositorio.iterar(Municipio, "2024"))
+
+    copia = pickle.loads(pickle.dumps(repositorio))
+
+    assert len(copia.mapa) == 0
+    assert next(copia.iterar(Municipio, "2024")) == instancia
@@ -0,0 +1,140 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from newbrain.mge.adapters.RepositorioMGEMemoria import RepositorioMGEMemoria
+from newbrain.mge.application.CacheExpedientes import CacheExpedientes
+from newbrain.mge.application.ConstructorExpedientes import (
+    ConstructorExpedientes,
+    SolicitudExpediente,
+)
+from newbrain.mge.application.VueloUnicoExpedientes import VueloUnicoExpedientes
+from newbrain.mge.domain.entities.EntidadFederativa import EntidadFederativa
+from newbrain.mge.domain.entities.Municipio import Municipio
+from newbrain.mge.domain.entities.ProcesoElectoral import ProcesoElectoral
+
+
+def sample_repositorio():
+    repo = RepositorioMGEMemoria()
+    repo.agregar(
+        [
+            ProcesoElectoral(
+                "2024", "PE2024", "Proceso Electoral 2024", date(2024, 1, 1), date(2024, 12, 31)
+            ),
+            EntidadFederativa(30, "VERACRUZ DE IGNACIO DE LA LLAVE", "Veracruz", "VR", "VER"),
+            Municipio(1, "2024", 30, 87, "Xalapa", "Xalapa-Enríquez"),
+        ]
+    )
+    return repo
+
+
+class ConstructorLento:
+    def __init__(self):
+        self.llamadas = 0
+        self.liberar = asyncio.Event()
+
+    async def __call__(self, solicitud):
+        self.llamadas += 1
+        await self.liberar.wait()
+        if solicitud.unidad_id == 99:
+            raise LookupError("no existe")
+        return f"expediente {solicitud}"
+
+
+def test_solicitudes_concurrentes_identicas_se_coalescen():
+    async def escenario():
+        constructor = ConstructorLento()
+        vuelo = VueloUnicoExpedientes(constructor)
+        solicitud = SolicitudExpediente("2024", 30, "seccion", 1)
+
+        tareas = [asyncio.create_task(vuelo.obtener(solicitud)) for _ in range(10)]
+        await asyncio.sleep(0)
+        constructor.liberar.set()
+        resultados = await asyncio.gather(*tareas)
+        return constructor, vuelo, resultados
+
+    constructor, vuelo, resultados = asyncio.run(escenario())
+
+    assert constructor.llamadas == 1
+    assert len(set(resultados)) == 1
+    assert vuelo.metricas.solicitudes == 10
+    assert vuelo.metricas.coalescidas == 9
+    assert vuelo.metricas.en_vuelo == 0
+
+
+def test_solicitudes_distintas_no_se_coalescen():
+    async def escenario():
+        constructor = ConstructorLento()
+        constructor.liberar.set()
+        vuelo = VueloUnicoExpedientes(constructor)
+        await asyncio.gather(
+            vuelo.obtener(SolicitudExpediente("2024", 30, "seccion", 1)),
+            vuelo.obtener(SolicitudExpediente("2024", 30, "seccion", 2)),
+        )
+        return constructor
+
+    assert asyncio.run(escenario()).llamadas == 2
+
+
+def test_error_se_entrega_a_todos_y_no_queda_en_cache():
+    async def escenario():
+        constructor = ConstructorLento()
+        vuelo = VueloUnicoExpedientes(constructor)
+        solicitud = SolicitudExpediente("2024", 30, "seccion", 99)
+
+        tareas = [asyncio.create_task(vuelo.obtener(solicitud)) for _ in range(3)]
+        await asyncio.sleep(0)
+        constructor.liberar.set()
+        resultados = await asyncio.gather(*tareas, return_exceptions=True)
+        assert all(isinstance(r, LookupError) for r in resultados)
+
+        with pytest.raises(LookupError):
+            await vuelo.obtener(solicitud)
+        return constructor, vuelo
+
+    constructor, vuelo = asyncio.run(escenario())
+    assert constructor.llamadas == 2
+    assert vuelo.metricas.errores == 2
+
+
+def test_cancelar_al_iniciador_no_cancela_la_construccion():
+    async def escenario():
+        constructor = ConstructorLento()
+        vuelo = VueloUnicoExpedientes(constructor)
+        solicitud = SolicitudExpediente("2024", 30, "seccion", 1)
+
+        iniciador = asyncio.create_task(vuelo.obtener(solicitud))
+        seguidor = asyncio.create_task(vuelo.obtener(solicitud))
+        await asyncio.sleep(0)
+        iniciador.cancel()
+        constructor.liberar.set()
+        return await seguidor
+
+    assert asyncio.run(escenario()).startswith("expediente")
+
+
+def test_desde_constructor_sincrono():
+    vuelo = VueloUnicoExpedientes.desde_constructor(ConstructorExpedientes(sample_repositorio()))
+    exp = asyncio.run(vuelo.obtener(SolicitudExpediente("2024", 30, "municipio", 1)))
+
+    assert exp.municipios[0].municipio_id == 87
+
+
+def test_cache_evita_construir_de_nuevo():
+    cache = CacheExpedientes()
+    vuelo = VueloUnicoExpedientes.desde_constructor(
+        ConstructorExpedientes(sample_repositorio()), cache
+    )
+    solicitud = SolicitudExpediente("2024", 30, "municipio", 1)
+
+    async def escenario():
+        primero = await vuelo.obtener(solicitud)
+        segundo = await vuelo.obtener(solicitud)
+        return primero, segundo
+
+    primero, segundo = asyncio.run(escenario())
+    assert primero is segundo
+    assert solicitud in cache
+    assert vuelo.metricas.construcciones == 1
+    assert vuelo.metricas.aciertos_cache == 1